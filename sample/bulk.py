@@ -6,31 +6,22 @@ from dotenv import load_dotenv
 
 from custom_simple_salesforce import Sf, SfBulk
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
-load_dotenv()
-
-# env
-_ENV = os.environ.copy()
-
-CLIENT_ID = _ENV.get("CLIENT_ID")
-CLIENT_SECRET = _ENV.get("CLIENT_SECRET")
-DOMAIN = _ENV.get("DOMAIN")
-
-
 def main() -> None:
     """Bulk Sample."""
+    load_dotenv()
+
+    client_id = os.environ.get("CLIENT_ID")
+    client_secret = os.environ.get("CLIENT_SECRET")
+    domain = os.environ.get("DOMAIN")
+
     settings = {
         "auth_method": "client_credentials",
-        "client_id": CLIENT_ID,
-        "client_secret": CLIENT_SECRET,
-        "domain": DOMAIN,
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "domain": domain,
     }
 
     sf_client = Sf.connection(settings)
@@ -88,4 +79,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     main()
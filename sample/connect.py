@@ -6,35 +6,26 @@ from dotenv import load_dotenv
 
 from custom_simple_salesforce import Sf
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
 logger = logging.getLogger(__name__)
 
 
-load_dotenv()
-
-# env
-_ENV = os.environ.copy()
-
-DOMAIN = _ENV.get("DOMAIN")
-USERNAME = _ENV.get("USERNAME")
-PASSWORD = _ENV.get("PASSWORD")
-SECURITY_TOKEN = _ENV.get("SECURITY_TOKEN")
+def main() -> None:
+    """Conect Sample."""
+    load_dotenv()
 
-CLIENT_ID = _ENV.get("CLIENT_ID")
-CLIENT_SECRET = _ENV.get("CLIENT_SECRET")
+    domain = os.environ.get("DOMAIN")
+    username = os.environ.get("USERNAME")
+    password = os.environ.get("PASSWORD")
+    security_token = os.environ.get("SECURITY_TOKEN")
 
+    client_id = os.environ.get("CLIENT_ID")
+    client_secret = os.environ.get("CLIENT_SECRET")
 
-def main() -> None:
-    """Conect Sample."""
     id_json = {
         "auth_method": "password",
-        "username": USERNAME,
-        "password": PASSWORD,
-        "security_token": SECURITY_TOKEN,
+        "username": username,
+        "password": password,
+        "security_token": security_token,
         "domain": "login",
     }
 
@@ -43,9 +34,9 @@ def main() -> None:
 
     id_json_str = f"""{{
         "auth_method": "password",
-        "username": {USERNAME},
-        "password": {PASSWORD},
-        "security_token": {SECURITY_TOKEN},
+        "username": {username},
+        "password": {password},
+        "security_token": {security_token},
         "domain": "login",
     }}"""
 
@@ -55,9 +46,9 @@ def main() -> None:
     # https://help.salesforce.com/s/articleView?id=xcloud.remoteaccess_oauth_client_credentials_flow.htm&type=5
     credential_yaml = f"""
     auth_method: client_credentials
-    client_id: {CLIENT_ID}
-    client_secret: {CLIENT_SECRET}
-    domain: {DOMAIN}
+    client_id: {client_id}
+    client_secret: {client_secret}
+    domain: {domain}
     """
 
     sf_client = Sf.connection(credential_yaml)
@@ -70,4 +61,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     main()
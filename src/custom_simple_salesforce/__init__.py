@@ -3,9 +3,12 @@
 This package provides:
 - Sf: A client for the Salesforce REST API.
 - SfBulk: A client for the Salesforce Bulk API 2.0.
+- AsyncSfBulk: An asyncio client for the Salesforce Bulk API 2.0
+  (requires the `async` extra).
 """
 
 from .bulk import SfBulk
+from .bulk_async import AsyncSfBulk
 from .client import Sf
 
-__all__ = ["Sf", "SfBulk"]
+__all__ = ["AsyncSfBulk", "Sf", "SfBulk"]
@@ -7,16 +7,154 @@ of bulk jobs for queries and DML operations through logically separated
 """
 
 import csv
+import gzip
 import io
-from copy import deepcopy
-from time import sleep
-from typing import Any, cast, get_args
+import os
+import tempfile
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from time import monotonic, sleep
+from types import TracebackType
+from typing import IO, Any, ClassVar, Self, cast, get_args
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .bulk_job import SfBulkJob, SfBulkJobQuery
+from .bulk_job import SfBulkCompositeJob, SfBulkJob, SfBulkJobQuery
 from .client import Sf
-from .types import FormatType, ResultType
+from .polling import (
+    MAX_RATE_LIMIT_RETRIES,
+    TERMINAL_STATES,
+    PollSettings,
+    retry_after_delay,
+)
+from .results import (
+    COLUMNAR_FORMATS,
+    ResultStream,
+    iter_rows,
+    load_json,
+    merge_results,
+    parse_columnar,
+    parse_csv,
+    validate_format_type,
+)
+from .transport import bulk_headers, resolve_url
+from .types import (
+    FormatType,
+    OperationType,
+    ResultType,
+    UploadDataType,
+)
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+# zlib window bits selecting the gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+# Stay well below the 150 MB per-job upload limit of Bulk API 2.0.
+_MAX_UPLOAD_BYTES = 100_000_000
+# Result keys of Ingest.get_all_results and the job resources they come from.
+_INGEST_RESULT_RESOURCES = {
+    "successful": "successfulResults",
+    "failed": "failedResults",
+    "unprocessed": "unprocessedrecords",
+}
+
+
+def _split_csv(
+    csv_data: str,
+    chunk_rows: int,
+    max_bytes: int = _MAX_UPLOAD_BYTES,
+) -> Iterator[str]:
+    """Split CSV data on row boundaries, repeating the header (internal helper).
+
+    A chunk holds at most `chunk_rows` rows and, unless a single row is
+    larger, at most `max_bytes` bytes once encoded as UTF-8 (the upload limit
+    is on bytes, and non-ASCII text takes up to 4 bytes per character). Rows
+    are parsed with `csv`, so quoted fields containing line breaks are never
+    split.
+    """
+    _reader = csv.reader(io.StringIO(csv_data, newline=""))
+    _header = next(_reader, None)
+    if _header is None:
+        return
+
+    _line = io.StringIO()
+    _writer = csv.writer(_line, lineterminator="\n")
+
+    def _format(row: list[str]) -> tuple[str, int]:
+        _line.seek(0)
+        _line.truncate()
+        _writer.writerow(row)
+        _text = _line.getvalue()
+        return _text, len(_text) if _text.isascii() else len(_text.encode("utf-8"))
+
+    _header_text, _header_size = _format(_header)
+    _lines = [_header_text]
+    _size = _header_size
+    for _row in _reader:
+        _text, _row_size = _format(_row)
+        if len(_lines) > 1 and _size + _row_size > max_bytes:
+            yield "".join(_lines)
+            _lines = [_header_text]
+            _size = _header_size
+        _lines.append(_text)
+        _size += _row_size
+        if len(_lines) > chunk_rows:
+            yield "".join(_lines)
+            _lines = [_header_text]
+            _size = _header_size
+    if len(_lines) > 1:
+        yield "".join(_lines)
+
+
+def _can_resend(body: bytes | IO[bytes] | Iterable[bytes]) -> bool:
+    """Check if an upload body can be sent again on retry (internal helper).
+
+    urllib3 rewinds seekable file bodies before retrying; iterators and
+    non-seekable streams would be resent empty.
+    """
+    if isinstance(body, bytes):
+        return True
+    _seekable = getattr(body, "seekable", None)
+    return _seekable is not None and _seekable()
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress byte chunks into a gzip stream on the fly (internal helper)."""
+    _compressor = zlib.compressobj(wbits=_GZIP_WBITS)
+    for _chunk in chunks:
+        if _compressed := _compressor.compress(_chunk):
+            yield _compressed
+    yield _compressor.flush()
+
+
+def _gzip_body(
+    body: bytes | IO[bytes] | Iterable[bytes],
+) -> bytes | IO[bytes] | Iterator[bytes]:
+    """Gzip an upload body, keeping it resendable if it was (internal helper).
+
+    Bytes are compressed in memory and seekable files into a temporary file,
+    which the caller must close; both can be rewound for a retried request.
+    Other streams are compressed on the fly.
+    """
+    if isinstance(body, bytes):
+        return gzip.compress(body)
+    if hasattr(body, "read"):
+        _file = cast("IO[bytes]", body)
+        _chunks = _gzip_chunks(iter(partial(_file.read, _UPLOAD_CHUNK_SIZE), b""))
+        if not _can_resend(_file):
+            return _chunks
+        _compressed = tempfile.TemporaryFile()  # noqa: SIM115
+        _compressed.writelines(_chunks)
+        _compressed.seek(0)
+        return _compressed
+    return _gzip_chunks(body)
 
 
 class SfBulk:
@@ -28,27 +166,69 @@ class SfBulk:
 
     Attributes:
         bulk2_url (str): The base URL for Bulk API 2.0 endpoints.
-        headers (dict[str, str]): The HTTP headers for authentication.
+        headers (dict[str, str]): The HTTP headers for authentication and
+            content negotiation.
         query (Query): Handler for query operations.
         ingest (Ingest): Handler for ingest (CRUD) operations.
         _interval (int): The default waiting interval in seconds.
+        _poll_settings (PollSettings): The backoff schedule used while waiting.
         _timeout (int): The request timeout in seconds.
+        _session (requests.Session): The pooled HTTP session shared by all requests.
+        _stream_session (requests.Session): A pooled session without retries,
+            for upload bodies that cannot be resent.
+        _job_info_validators (dict[str, tuple[str, str, dict[str, Any]]]): The
+            conditional-request header, its value and the last job information,
+            keyed by job endpoint, for jobs that are still running.
 
     Args:
         sf (Sf): An authenticated Salesforce client instance.
         interval (int): The default interval in seconds for waiting job status.
+            When `poll_settings` is not given, the backoff ceiling is six times
+            this value.
         timeout (int): The timeout in seconds for API requests.
+        poll_settings (PollSettings | None): The backoff schedule between
+            status checks. Defaults to delays doubling from 0.5 seconds up to
+            `6 * interval` with a small jitter, so small jobs are seen to
+            complete within about a second, overridable with the
+            `SF_BULK_POLL_*` environment variables (see
+            `PollSettings.from_env`). Pass `interval` to `wait` for a
+            constant delay instead.
 
     """
 
+    _OPERATIONS: ClassVar[frozenset[str]] = frozenset(get_args(OperationType.__value__))
+
+    # No per-instance __dict__; subclasses that add attributes need their own
+    # __slots__ (or get a __dict__ back by omitting it).
+    __slots__ = (
+        "_ingest",
+        "_interval",
+        "_job_info_validators",
+        "_poll_settings",
+        "_query",
+        "_session",
+        "_stream_session",
+        "_timeout",
+        "bulk2_url",
+        "headers",
+    )
+
     bulk2_url: str
     headers: dict[str, str]
+    _query: "SfBulk.Query | None"
+    _ingest: "SfBulk.Ingest | None"
     _interval: int
+    _poll_settings: PollSettings
     _timeout: int
+    _session: requests.Session
+    _stream_session: requests.Session
+    _job_info_validators: dict[str, tuple[str, str, dict[str, Any]]]
 
     class Query:
         """Handle Bulk API 2.0 Query operations."""
 
+        __slots__ = ("_sf_bulk",)
+
         def __init__(self, sf_bulk: "SfBulk") -> None:
             """Initialize the Query operations handler."""
             self._sf_bulk = sf_bulk
@@ -81,7 +261,7 @@ class SfBulk:
             )
             return SfBulkJobQuery(
                 self._sf_bulk,
-                cast("dict[str, Any]", _response.json()),
+                cast("dict[str, Any]", load_json(_response.content)),
             )
 
         def get_info(self, job_id: str) -> dict[str, Any]:
@@ -94,56 +274,115 @@ class SfBulk:
                 A dictionary containing the job's information.
 
             """
-            _response = self._sf_bulk._make_request("GET", f"query/{job_id}")  # noqa: SLF001
-            return cast("dict[str, Any]", _response.json())
+            return self._sf_bulk._get_job_info(f"query/{job_id}")  # noqa: SLF001
 
         def wait(
             self,
             job_id: str,
-            interval: int | None = None,
+            interval: float | None = None,
+            timeout: float | None = None,
         ) -> dict[str, Any]:
             """Wait a query job's status until it completes.
 
             Args:
                 job_id: The ID of the query job to wait.
-                interval: The waiting interval in seconds. If None,
-                    the default is used.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+                timeout: The maximum waiting time in seconds. If None, the
+                    timeout of the client's poll settings is used.
 
             Returns:
                 The final job information dictionary after completion.
 
+            Raises:
+                TimeoutError: If the job does not finish within the timeout.
+
             """
-            final_interval = self._sf_bulk._get_final_interval(interval)  # noqa: SLF001
-            while True:
-                _job_info = self.get_info(job_id)
-                if _job_info["state"] in ["Aborted", "JobComplete", "Failed"]:
-                    break
-                sleep(final_interval)
-            return _job_info
+            return self._sf_bulk._wait_for_terminal(  # noqa: SLF001
+                self.get_info,
+                job_id,
+                interval,
+                timeout,
+            )
 
         def get_results(
             self,
             job_id: str,
             format_type: FormatType = "dict",
+            *,
+            parallel: int = 1,
         ) -> ResultType:
             """Get the results of a completed query job.
 
             Args:
                 job_id: The ID of the query job.
                 format_type: The desired output format.
+                parallel: The number of result pages to download concurrently.
+                    If greater than 1, the pages are enumerated through the
+                    'resultPages' endpoint and fetched in parallel.
+                    Defaults to 1 (a single sequential download).
 
             Returns:
                 The query results in the specified format.
 
             """
+            if parallel > 1:
+                return self._sf_bulk._get_paged_csv_results(  # noqa: SLF001
+                    job_id,
+                    format_type,
+                    parallel,
+                )
             return self._sf_bulk._get_csv_results(  # noqa: SLF001
                 f"query/{job_id}/results",
                 format_type,
             )
 
+        def iter_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> ResultStream:
+            """Stream the results of a completed query job row by row.
+
+            Rows are parsed while the response body is being received, so
+            memory use stays constant regardless of the result size. The
+            connection is released once the stream is exhausted or closed;
+            use `to_list()` on the stream to read every row at once.
+
+            Args:
+                job_id: The ID of the query job.
+                format_type: The desired row format, 'dict' or 'reader'.
+
+            Returns:
+                A closable iterator over the result rows.
+
+            """
+            return self._sf_bulk._iter_csv_rows(  # noqa: SLF001
+                f"query/{job_id}/results",
+                format_type,
+            )
+
+        def download_results(self, job_id: str, file: IO[bytes]) -> int:
+            """Write the raw CSV results of a completed query job to a file.
+
+            The body is copied in fixed-size chunks without being parsed or
+            held in memory as a whole.
+
+            Args:
+                job_id: The ID of the query job.
+                file: A binary file-like object to write the CSV data to.
+
+            Returns:
+                The number of bytes written.
+
+            """
+            return self._sf_bulk._download_csv(f"query/{job_id}/results", file)  # noqa: SLF001
+
     class Ingest:
         """Handle Bulk API 2.0 Ingest (CRUD) operations."""
 
+        __slots__ = ("_sf_bulk",)
+
         def __init__(self, sf_bulk: "SfBulk") -> None:
             """Initialize the Ingest operations handler."""
             self._sf_bulk = sf_bulk
@@ -213,20 +452,94 @@ class SfBulk:
             """
             return self._sf_bulk.create_job(object_name, "hardDelete")
 
-        def upload_data(self, job_id: str, csv_data: str) -> None:
+        def upload_data(
+            self,
+            job_id: str,
+            csv_data: UploadDataType,
+            *,
+            compress: bool = False,
+        ) -> None:
             """Upload CSV data to a job.
 
+            Bytes are sent without copying, and files, file paths and
+            iterables of bytes are streamed so the whole payload never has to
+            be held in memory.
+
             Args:
                 job_id: The ID of the ingest job.
-                csv_data: A string containing the data in CSV format.
+                csv_data: The data in CSV format, as a string, UTF-8 bytes,
+                    a file path, a binary file-like object, or an iterable of
+                    UTF-8 byte chunks (sent with chunked transfer encoding).
+                compress: If True, the body is gzip-compressed (streamed for
+                    files and iterables) and sent with `Content-Encoding: gzip`.
+                    Typical CSV data shrinks 5-10x. Defaults to False.
 
             """
-            self._sf_bulk._make_request(  # noqa: SLF001
-                "PUT",
-                f"ingest/{job_id}/batches",
-                headers={"Content-Type": "text/csv"},
-                data=csv_data.encode("utf-8"),
-            )
+            if isinstance(csv_data, os.PathLike):
+                self.upload_file(job_id, csv_data, compress=compress)
+                return
+
+            _headers = {"Content-Type": "text/csv"}
+            _body = csv_data.encode("utf-8") if isinstance(csv_data, str) else csv_data
+            if not isinstance(_body, bytes) and not hasattr(_body, "read"):
+                # requests form-encodes lists and tuples; stream them instead.
+                _body = iter(cast("Iterable[bytes]", _body))
+            if compress:
+                _headers["Content-Encoding"] = "gzip"
+                _body = _gzip_body(_body)
+
+            try:
+                self._sf_bulk._make_request(  # noqa: SLF001
+                    "PUT",
+                    f"ingest/{job_id}/batches",
+                    headers=_headers,
+                    data=_body,
+                    retry=_can_resend(_body),
+                )
+            finally:
+                if _body is not csv_data and hasattr(_body, "close"):
+                    # A compressed copy made by _gzip_body.
+                    cast("IO[bytes]", _body).close()
+
+        def upload_file(
+            self,
+            job_id: str,
+            path: str | os.PathLike[str],
+            *,
+            compress: bool = False,
+        ) -> None:
+            """Upload a CSV file to a job, streaming it from disk.
+
+            Args:
+                job_id: The ID of the ingest job.
+                path: The path to a UTF-8 encoded CSV file.
+                compress: If True, the file is gzip-compressed while it is
+                    streamed. Defaults to False.
+
+            """
+            with Path(path).open("rb") as _file:
+                self.upload_data(job_id, _file, compress=compress)
+
+        def upload_and_complete(
+            self,
+            job_id: str,
+            csv_data: UploadDataType,
+            *,
+            compress: bool = False,
+        ) -> None:
+            """Upload CSV data to a job and mark the upload as complete.
+
+            Both requests are sent back to back over the same keep-alive
+            connection, so the completion costs no new connection setup.
+
+            Args:
+                job_id: The ID of the ingest job.
+                csv_data: The data in CSV format (see `upload_data`).
+                compress: If True, the body is sent gzip-compressed.
+
+            """
+            self.upload_data(job_id, csv_data, compress=compress)
+            self.complete_upload(job_id)
 
         def complete_upload(self, job_id: str) -> None:
             """Signal that data upload is complete for a job.
@@ -244,6 +557,21 @@ class SfBulk:
                 json={"state": "UploadComplete"},
             )
 
+        def abort(self, job_id: str) -> None:
+            """Abort an ingest job.
+
+            Records that Salesforce has already processed are not rolled back.
+
+            Args:
+                job_id: The ID of the ingest job.
+
+            """
+            self._sf_bulk._make_request(  # noqa: SLF001
+                "PATCH",
+                f"ingest/{job_id}",
+                json={"state": "Aborted"},
+            )
+
         def get_info(self, job_id: str) -> dict[str, Any]:
             """Get information about a specific ingest job.
 
@@ -254,34 +582,36 @@ class SfBulk:
                 A dictionary containing the job's information.
 
             """
-            _response = self._sf_bulk._make_request(  # noqa: SLF001
-                "GET",
-                f"ingest/{job_id}",
-            )
-            return cast("dict[str, Any]", _response.json())
+            return self._sf_bulk._get_job_info(f"ingest/{job_id}")  # noqa: SLF001
 
         def wait(
             self,
             job_id: str,
-            interval: int | None = None,
+            interval: float | None = None,
+            timeout: float | None = None,
         ) -> dict[str, Any]:
             """Wait an ingest job's status until it completes.
 
             Args:
                 job_id: The ID of the ingest job to wait.
-                interval: The waiting interval in seconds. If None, the default is used.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+                timeout: The maximum waiting time in seconds. If None, the
+                    timeout of the client's poll settings is used.
 
             Returns:
                 The final job information dictionary after completion.
 
+            Raises:
+                TimeoutError: If the job does not finish within the timeout.
+
             """
-            final_interval = self._sf_bulk._get_final_interval(interval)  # noqa: SLF001
-            while True:
-                _job_info = self.get_info(job_id)
-                if _job_info["state"] in ["Aborted", "JobComplete", "Failed"]:
-                    break
-                sleep(final_interval)
-            return _job_info
+            return self._sf_bulk._wait_for_terminal(  # noqa: SLF001
+                self.get_info,
+                job_id,
+                interval,
+                timeout,
+            )
 
         def get_successful_results(
             self,
@@ -343,87 +673,425 @@ class SfBulk:
                 format_type,
             )
 
-    def __init__(self: "SfBulk", sf: Sf, interval: int = 5, timeout: int = 30) -> None:
+        def get_all_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> dict[str, ResultType]:
+            """Get the successful, failed and unprocessed records at once.
+
+            The three result downloads are independent, so they are fetched
+            concurrently over the client's connection pool.
+
+            Args:
+                job_id: The ID of the ingest job.
+                format_type: The desired output format. Defaults to 'dict'.
+
+            Returns:
+                A dictionary with the 'successful', 'failed' and 'unprocessed'
+                records in the specified format.
+
+            """
+            validate_format_type(format_type)
+            _endpoints = {
+                _key: f"ingest/{job_id}/{_resource}"
+                for _key, _resource in _INGEST_RESULT_RESOURCES.items()
+            }
+            with ThreadPoolExecutor(max_workers=len(_endpoints)) as executor:
+                _futures = {
+                    _key: executor.submit(
+                        self._sf_bulk._get_csv_results,  # noqa: SLF001
+                        _endpoint,
+                        format_type,
+                    )
+                    for _key, _endpoint in _endpoints.items()
+                }
+            return {_key: _future.result() for _key, _future in _futures.items()}
+
+    def __init__(
+        self: "SfBulk",
+        sf: Sf,
+        interval: int = 5,
+        timeout: int = 30,
+        *,
+        poll_settings: PollSettings | None = None,
+    ) -> None:
         """Initialize the SfBulk client."""
         self.bulk2_url = sf.bulk2_url
-        self.headers = sf.headers
+        self.headers = bulk_headers(sf.headers)
         self._interval = interval
+        self._poll_settings = poll_settings or PollSettings.from_env(
+            max_delay=interval * 6,
+        )
         self._timeout = timeout
 
-        # Instantiate nested handlers
-        self.query = self.Query(self)
-        self.ingest = self.Ingest(self)
+        # Keep-alive connection pool shared by every request of this client
+        self._session = self._new_session(
+            Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                # Hand the last response back so raise_for_status reports it
+                raise_on_status=False,
+            ),
+        )
+        # Streamed uploads (iterators, non-seekable files) would be resent
+        # empty on retry, so they go through a session that never retries.
+        self._stream_session = self._new_session(Retry(total=0, read=False))
+        self._job_info_validators = {}
+
+        # Nested handlers are created on first access
+        self._query = None
+        self._ingest = None
+
+    @property
+    def query(self: "SfBulk") -> "SfBulk.Query":
+        """Handler for query operations."""
+        if self._query is None:
+            self._query = self.Query(self)
+        return self._query
+
+    @property
+    def ingest(self: "SfBulk") -> "SfBulk.Ingest":
+        """Handler for ingest (CRUD) operations."""
+        if self._ingest is None:
+            self._ingest = self.Ingest(self)
+        return self._ingest
+
+    def __enter__(self: "SfBulk") -> Self:
+        """Return the client itself for use as a context manager."""
+        return self
+
+    def __exit__(
+        self: "SfBulk",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the connection pool when leaving the context."""
+        self.close()
+
+    def close(self: "SfBulk") -> None:
+        """Close the underlying HTTP sessions and release their connections."""
+        self._session.close()
+        self._stream_session.close()
+
+    def _new_session(self: "SfBulk", retries: Retry) -> requests.Session:
+        """Create a keep-alive session with a bounded pool (internal helper)."""
+        _session = requests.Session()
+        _session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=5,
+                pool_maxsize=25,
+                # Wait for a free connection instead of opening (and discarding)
+                # extra ones when many threads share the client.
+                pool_block=True,
+                max_retries=retries,
+            ),
+        )
+        _session.headers.update(self.headers)
+        return _session
 
     def _make_request(
         self: "SfBulk",
         method: str,
         endpoint: str,
         headers: dict[str, Any] | None = None,
+        *,
+        retry: bool = True,
         **kwargs: Any,  # noqa: ANN401
     ) -> requests.Response:
-        """Send an API request and check its status (internal helper)."""
-        final_headers = deepcopy(self.headers)
-        if headers:
-            final_headers.update(headers)
-
-        _response = requests.request(
+        """Send an API request and check its status (internal helper).
+
+        The session already carries the authentication headers, so only the
+        per-call overrides are passed here. Idempotent requests are retried by
+        the session's adapter (honoring `Retry-After`); other rate-limited
+        (HTTP 429) requests are retried here after the `Retry-After` delay.
+        With `retry=False` the request is sent exactly once, for bodies that
+        cannot be resent.
+        """
+        _session = self._session if retry else self._stream_session
+        _url = resolve_url(self.bulk2_url, endpoint)
+        _response = _session.request(
             method,
-            f"{self.bulk2_url}{endpoint}",
-            headers=final_headers,
+            _url,
+            headers=headers,
             timeout=self._timeout,
             **kwargs,
         )
+        _retries = 0
+        while (
+            retry
+            and _response.status_code == requests.codes.too_many_requests
+            and method.upper() not in Retry.DEFAULT_ALLOWED_METHODS
+            and _retries < MAX_RATE_LIMIT_RETRIES
+        ):
+            sleep(
+                retry_after_delay(
+                    _response.headers.get("Retry-After"),
+                    self._poll_settings.delay(_retries),
+                ),
+            )
+            _retries += 1
+            _response = _session.request(
+                method,
+                _url,
+                headers=headers,
+                timeout=self._timeout,
+                **kwargs,
+            )
         _response.raise_for_status()
         return _response
 
+    def _get_job_info(self: "SfBulk", endpoint: str) -> dict[str, Any]:
+        """Fetch job information with a conditional GET (internal helper).
+
+        If the previous response carried an `ETag` (or `Last-Modified`) header,
+        it is sent back as `If-None-Match` (or `If-Modified-Since`) and an
+        HTTP 304 response reuses the last known information without a body.
+        """
+        _validator = self._job_info_validators.get(endpoint)
+        _response = self._make_request(
+            "GET",
+            endpoint,
+            headers={_validator[0]: _validator[1]} if _validator else None,
+        )
+        if _validator and _response.status_code == requests.codes.not_modified:
+            return _validator[2]
+
+        _job_info = cast("dict[str, Any]", load_json(_response.content))
+        if _job_info.get("state") in TERMINAL_STATES:
+            # The job will not change any more, so stop tracking it.
+            self._job_info_validators.pop(endpoint, None)
+        elif _etag := _response.headers.get("ETag"):
+            self._job_info_validators[endpoint] = ("If-None-Match", _etag, _job_info)
+        elif _last_modified := _response.headers.get("Last-Modified"):
+            self._job_info_validators[endpoint] = (
+                "If-Modified-Since",
+                _last_modified,
+                _job_info,
+            )
+        return _job_info
+
     def _get_csv_results(
         self,
         endpoint: str,
         format_type: FormatType,
     ) -> ResultType:
         """Retrieve and parse CSV results from a given endpoint (internal helper)."""
-        allowed_formats = get_args(FormatType.__value__)
-        if format_type not in allowed_formats:
-            err_msg = (
-                f"Unsupported format: '{format_type}'. "
-                f"Allowed formats are: {', '.join(allowed_formats)}"
+        validate_format_type(format_type)
+
+        # Parse while the body is being received instead of buffering it first.
+        with self._make_request("GET", endpoint, stream=True) as _response:
+            # Read the raw stream (with gzip/deflate decoding) rather than
+            # iter_lines(), which would split on carriage returns inside quoted
+            # multi-line fields. Raw CSV is decoded straight into one string.
+            _response.raw.decode_content = True
+            # urllib3 closes the raw stream once drained, while TextIOWrapper
+            # and csv still read from it; the `with` block closes it instead.
+            _response.raw.auto_close = False
+            if format_type in COLUMNAR_FORMATS:
+                return parse_columnar(_response.raw, format_type)
+            return parse_csv(
+                io.TextIOWrapper(_response.raw, encoding="utf-8", newline=""),
+                format_type,
+            )
+
+    def _iter_csv_rows(
+        self,
+        endpoint: str,
+        format_type: FormatType,
+    ) -> ResultStream:
+        """Request CSV results and parse them lazily (internal helper).
+
+        The request is sent immediately so that HTTP errors surface here; the
+        body is only read as the returned iterator is consumed.
+        """
+        validate_format_type(format_type)
+        if format_type == "csv" or format_type in COLUMNAR_FORMATS:
+            error_msg = f"Format '{format_type}' cannot be streamed row by row."
+            raise ValueError(error_msg)
+
+        _response = self._make_request("GET", endpoint, stream=True)
+        # As in _get_csv_results, parse the decoded raw stream, not iter_lines(),
+        # and leave closing it to ResultStream.
+        _response.raw.decode_content = True
+        _response.raw.auto_close = False
+        return ResultStream(
+            iter_rows(
+                io.TextIOWrapper(_response.raw, encoding="utf-8", newline=""),
+                format_type,
+            ),
+            _response.close,
+        )
+
+    def _download_csv(self, endpoint: str, file: IO[bytes]) -> int:
+        """Copy CSV results to a binary file in chunks (internal helper)."""
+        _written = 0
+        with self._make_request("GET", endpoint, stream=True) as _response:
+            for _chunk in _response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                _written += file.write(_chunk)
+        return _written
+
+    def _get_paged_csv_results(
+        self,
+        job_id: str,
+        format_type: FormatType,
+        parallel: int,
+    ) -> ResultType:
+        """Download query result pages concurrently and merge them (internal helper).
+
+        Each page is a complete CSV document with its own header row, so the
+        header is kept only from the first page when the pages are merged.
+        """
+        validate_format_type(format_type)
+
+        _result_links: list[str] = []
+        _endpoint: str | None = f"query/{job_id}/resultPages"
+        while _endpoint:
+            _page_info = cast(
+                "dict[str, Any]",
+                load_json(self._make_request("GET", _endpoint).content),
+            )
+            _result_links.extend(
+                _page["resultLink"] for _page in _page_info.get("resultPages", [])
             )
-            raise ValueError(err_msg)
-
-        _response = self._make_request("GET", endpoint)
-        _response.encoding = "utf-8"
-
-        _csv_data_io = io.StringIO(_response.text)
-        match format_type:
-            case "dict":
-                return list(csv.DictReader(_csv_data_io))
-            case "reader":
-                return list(csv.reader(_csv_data_io))
-            case "csv":
-                return _response.text
-            case _:
-                # This should be unreachable
-                err_msg = "Internal error: Unsupported format."
-                raise ValueError(err_msg)
-
-    def _get_final_interval(self, interval: int | None) -> int:
-        """Determine the final waiting interval (internal helper)."""
-        return interval if interval is not None else self._interval
+            _endpoint = _page_info.get("nextRecordsUrl")
+
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            _pages = list(
+                executor.map(
+                    partial(self._get_csv_results, format_type=format_type),
+                    _result_links,
+                ),
+            )
+
+        return merge_results(_pages, format_type)
+
+    def _get_delay(self, attempt: int, interval: float | None) -> float:
+        """Determine the delay before the next status check (internal helper)."""
+        if interval is not None:
+            return interval
+        return self._poll_settings.delay(attempt)
+
+    def _wait_for_terminal(
+        self,
+        get_info: Callable[[str], dict[str, Any]],
+        job_id: str,
+        interval: float | None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Poll a job until it reaches a terminal state (internal helper)."""
+        if timeout is None:
+            timeout = self._poll_settings.timeout
+        _deadline = None if timeout is None else monotonic() + timeout
+        _attempt = 0
+        while True:
+            _job_info = get_info(job_id)
+            if _job_info["state"] in TERMINAL_STATES:
+                return _job_info
+            _delay = self._get_delay(_attempt, interval)
+            if _deadline is not None:
+                _remaining = _deadline - monotonic()
+                if _remaining <= 0:
+                    error_msg = (
+                        f"Job {job_id} did not finish within {timeout} seconds "
+                        f"(last state: {_job_info['state']})."
+                    )
+                    raise TimeoutError(error_msg)
+                _delay = min(_delay, _remaining)
+            sleep(_delay)
+            _attempt += 1
 
     def create_job(
         self: "SfBulk",
         object_name: str,
-        operation: str,
+        operation: OperationType,
         external_id_field: str | None = None,
     ) -> SfBulkJob:
         """Create a generic ingest job (internal helper)."""
+        if operation not in self._OPERATIONS:
+            error_msg = (
+                f"Unsupported operation: '{operation}'. "
+                f"Allowed operations are: {', '.join(sorted(self._OPERATIONS))}"
+            )
+            raise ValueError(error_msg)
         if operation == "upsert" and not external_id_field:
             error_msg = "The 'external_id_field' is required for 'upsert' operation."
             raise ValueError(error_msg)
 
-        _payload = {"object": object_name, "operation": operation}
-        if external_id_field:
-            _payload["externalIdFieldName"] = external_id_field
+        _payload = (
+            {
+                "object": object_name,
+                "operation": operation,
+                "externalIdFieldName": external_id_field,
+            }
+            if external_id_field
+            else {"object": object_name, "operation": operation}
+        )
 
         _response = self._make_request("POST", "ingest", json=_payload)
-        return SfBulkJob(self, cast("dict[str, Any]", _response.json()))
+        return SfBulkJob(self, cast("dict[str, Any]", load_json(_response.content)))
+
+    def ingest_parallel(  # noqa: PLR0913
+        self: "SfBulk",
+        object_name: str,
+        operation: OperationType,
+        csv_data: str,
+        *,
+        external_id_field: str | None = None,
+        max_workers: int = 4,
+        chunk_rows: int = 100_000,
+    ) -> SfBulkCompositeJob:
+        """Split CSV data into several ingest jobs and upload them concurrently.
+
+        The data is split on row boundaries into chunks of at most `chunk_rows`
+        rows, each with the header row. One job is created per chunk, and the
+        chunks are uploaded and marked complete in parallel so that Salesforce
+        can process them concurrently. Chunks are produced only as workers
+        become free, so at most `max_workers` of them are held at a time.
+
+        If any job fails to be created, uploaded or completed, every job
+        created so far is aborted and the error is raised.
+
+        Args:
+            object_name: The Salesforce object API name (e.g., 'Account').
+            operation: The ingest operation (e.g., 'insert', 'upsert').
+            csv_data: A string containing the data in CSV format.
+            external_id_field: The API name of the external ID field
+                (required for 'upsert').
+            max_workers: The maximum number of concurrent uploads.
+            chunk_rows: The maximum number of rows per job.
+
+        Returns:
+            An object to manage all of the created jobs together.
+
+        """
+        _created: list[SfBulkJob] = []
+
+        def _run_job(chunk: str) -> SfBulkJob:
+            _job = self.create_job(object_name, operation, external_id_field)
+            _created.append(_job)
+            _job.upload_and_complete(chunk)
+            return _job
+
+        _jobs: list[SfBulkJob] = []
+        _pending: deque[Future[SfBulkJob]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for _chunk in _split_csv(csv_data, chunk_rows):
+                    if len(_pending) >= max_workers:
+                        _jobs.append(_pending.popleft().result())
+                    _pending.append(executor.submit(_run_job, _chunk))
+                _jobs.extend(_future.result() for _future in _pending)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                # Do not leave the jobs open; keep the original error if
+                # aborting fails too.
+                for _job in _created:
+                    with suppress(requests.RequestException):
+                        self.ingest.abort(_job.id)
+                raise
+        return SfBulkCompositeJob(_jobs)
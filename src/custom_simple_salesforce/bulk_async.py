@@ -0,0 +1,810 @@
+"""Asynchronous Salesforce Bulk API 2.0 Client.
+
+This module provides the AsyncSfBulk class, an asyncio counterpart of SfBulk
+built on `httpx.AsyncClient`. Because every request shares one HTTP/2
+connection, many jobs can be polled and their results downloaded concurrently
+from a single event loop (e.g., with `asyncio.gather`).
+
+`httpx` is an optional dependency; install it with the `async` extra.
+"""
+
+import asyncio
+import gzip
+import io
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import suppress
+from http import HTTPStatus
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, ClassVar, Self, cast, get_args
+
+from .client import Sf
+from .polling import (
+    MAX_RATE_LIMIT_RETRIES,
+    TERMINAL_STATES,
+    PollSettings,
+    retry_after_delay,
+)
+from .results import (
+    COLUMNAR_FORMATS,
+    load_json,
+    parse_columnar,
+    parse_csv,
+    validate_format_type,
+)
+from .transport import bulk_headers, resolve_url
+from .types import FormatType, OperationType, ResultType
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncSfBulk:
+    """An asynchronous client for the Salesforce Bulk API 2.0.
+
+    This class mirrors `SfBulk` with `async` methods. Operations are grouped
+    under the `query` and `ingest` attributes. Methods return the raw job
+    information dictionaries from the API instead of job objects.
+
+    Attributes:
+        bulk2_url (str): The base URL for Bulk API 2.0 endpoints.
+        headers (dict[str, str]): The HTTP headers for authentication and
+            content negotiation.
+        query (Query): Handler for query operations.
+        ingest (Ingest): Handler for ingest (CRUD) operations.
+        _interval (int): The default waiting interval in seconds.
+        _poll_settings (PollSettings): The backoff schedule used while waiting.
+        _timeout (int): The request timeout in seconds.
+        _client (httpx.AsyncClient): The HTTP/2 client shared by all requests.
+
+    Args:
+        sf (Sf): An authenticated Salesforce client instance.
+        interval (int): The default interval in seconds for waiting job status.
+            When `poll_settings` is not given, the backoff ceiling is six times
+            this value.
+        timeout (int): The timeout in seconds for API requests.
+        poll_settings (PollSettings | None): The backoff schedule between
+            status checks. Defaults to the same schedule as `SfBulk`.
+
+    Raises:
+        ImportError: If `httpx` is not installed.
+
+    """
+
+    _OPERATIONS: ClassVar[frozenset[str]] = frozenset(get_args(OperationType.__value__))
+
+    bulk2_url: str
+    headers: dict[str, str]
+    _interval: int
+    _poll_settings: PollSettings
+    _timeout: int
+    _client: "httpx.AsyncClient"
+
+    class Query:
+        """Handle asynchronous Bulk API 2.0 Query operations."""
+
+        def __init__(self, sf_bulk: "AsyncSfBulk") -> None:
+            """Initialize the Query operations handler."""
+            self._sf_bulk = sf_bulk
+
+        async def create(
+            self,
+            query: str,
+            *,
+            include_all: bool = False,
+        ) -> dict[str, Any]:
+            """Create a query job.
+
+            Args:
+                query: The SOQL query to be executed.
+                include_all: If True, the operation is 'queryAll' to include
+                    archived and deleted records. Defaults to False.
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            _operation = "queryAll" if include_all else "query"
+            _response = await self._sf_bulk._make_request(  # noqa: SLF001
+                "POST",
+                "query",
+                json={
+                    "operation": _operation,
+                    "query": query,
+                },
+            )
+            return cast("dict[str, Any]", load_json(_response.content))
+
+        async def get_info(self, job_id: str) -> dict[str, Any]:
+            """Get information about a specific query job.
+
+            Args:
+                job_id: The ID of the query job.
+
+            Returns:
+                A dictionary containing the job's information.
+
+            """
+            _response = await self._sf_bulk._make_request("GET", f"query/{job_id}")  # noqa: SLF001
+            return cast("dict[str, Any]", load_json(_response.content))
+
+        async def wait(
+            self,
+            job_id: str,
+            interval: float | None = None,
+        ) -> dict[str, Any]:
+            """Wait a query job's status until it completes.
+
+            Args:
+                job_id: The ID of the query job to wait.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+
+            Returns:
+                The final job information dictionary after completion.
+
+            Raises:
+                TimeoutError: If the job does not finish within the timeout of
+                    the client's poll settings. Wrap the call in
+                    `asyncio.timeout()` for a per-call limit.
+
+            """
+            return await self._sf_bulk._wait_for_terminal(  # noqa: SLF001
+                self.get_info,
+                job_id,
+                interval,
+            )
+
+        async def wait_many(
+            self,
+            job_ids: list[str],
+            interval: float | None = None,
+            *,
+            max_concurrency: int = 20,
+        ) -> list[dict[str, Any]]:
+            """Wait several query jobs concurrently until they all complete.
+
+            Every job is polled in its own task, so the total wall time is that
+            of the slowest job rather than the sum over all jobs.
+
+            Args:
+                job_ids: The IDs of the query jobs to wait.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+                max_concurrency: The maximum number of status checks in
+                    flight at once.
+
+            Returns:
+                The final job information dictionaries, in the order of `job_ids`.
+
+            """
+            return await self._sf_bulk._wait_many(  # noqa: SLF001
+                self.get_info,
+                job_ids,
+                interval,
+                max_concurrency,
+            )
+
+        async def get_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> ResultType:
+            """Get the results of a completed query job.
+
+            Args:
+                job_id: The ID of the query job.
+                format_type: The desired output format.
+
+            Returns:
+                The query results in the specified format.
+
+            """
+            return await self._sf_bulk._get_csv_results(  # noqa: SLF001
+                f"query/{job_id}/results",
+                format_type,
+            )
+
+    class Ingest:
+        """Handle asynchronous Bulk API 2.0 Ingest (CRUD) operations."""
+
+        def __init__(self, sf_bulk: "AsyncSfBulk") -> None:
+            """Initialize the Ingest operations handler."""
+            self._sf_bulk = sf_bulk
+
+        async def create_insert(self, object_name: str) -> dict[str, Any]:
+            """Create an insert job.
+
+            Args:
+                object_name: The Salesforce object API name (e.g., 'Account').
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            return await self._sf_bulk.create_job(object_name, "insert")
+
+        async def create_update(self, object_name: str) -> dict[str, Any]:
+            """Create an update job.
+
+            Args:
+                object_name: The Salesforce object API name (e.g., 'Account').
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            return await self._sf_bulk.create_job(object_name, "update")
+
+        async def create_upsert(
+            self,
+            object_name: str,
+            external_id_field: str,
+        ) -> dict[str, Any]:
+            """Create an upsert job.
+
+            Args:
+                object_name: The Salesforce object API name (e.g., 'Account').
+                external_id_field: The API name of the external ID field.
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            return await self._sf_bulk.create_job(
+                object_name,
+                "upsert",
+                external_id_field,
+            )
+
+        async def create_delete(self, object_name: str) -> dict[str, Any]:
+            """Create a delete job (moves records to the recycle bin).
+
+            Args:
+                object_name: The Salesforce object API name (e.g., 'Account').
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            return await self._sf_bulk.create_job(object_name, "delete")
+
+        async def create_hard_delete(self, object_name: str) -> dict[str, Any]:
+            """Create a hard delete job (permanently deletes records).
+
+            Args:
+                object_name: The Salesforce object API name (e.g., 'Account').
+
+            Returns:
+                A dictionary containing the created job's information.
+
+            """
+            return await self._sf_bulk.create_job(object_name, "hardDelete")
+
+        async def upload_data(
+            self,
+            job_id: str,
+            csv_data: str | bytes,
+            *,
+            compress: bool = False,
+        ) -> None:
+            """Upload CSV data to a job.
+
+            Args:
+                job_id: The ID of the ingest job.
+                csv_data: The data in CSV format, as a string or UTF-8 bytes.
+                compress: If True, the body is sent gzip-compressed with
+                    `Content-Encoding: gzip`. Defaults to False.
+
+            """
+            _headers = {"Content-Type": "text/csv"}
+            _body = csv_data.encode("utf-8") if isinstance(csv_data, str) else csv_data
+            if compress:
+                _headers["Content-Encoding"] = "gzip"
+                # Compress in a worker thread so a large body does not block the loop.
+                _body = await asyncio.to_thread(gzip.compress, _body)
+
+            await self._sf_bulk._make_request(  # noqa: SLF001
+                "PUT",
+                f"ingest/{job_id}/batches",
+                headers=_headers,
+                content=_body,
+            )
+
+        async def upload_and_complete(
+            self,
+            job_id: str,
+            csv_data: str | bytes,
+            *,
+            compress: bool = False,
+        ) -> None:
+            """Upload CSV data to a job and mark the upload as complete.
+
+            Both requests share the client's HTTP/2 connection, so the
+            completion costs no new connection setup.
+
+            Args:
+                job_id: The ID of the ingest job.
+                csv_data: The data in CSV format, as a string or UTF-8 bytes.
+                compress: If True, the body is sent gzip-compressed.
+
+            """
+            await self.upload_data(job_id, csv_data, compress=compress)
+            await self.complete_upload(job_id)
+
+        async def complete_upload(self, job_id: str) -> None:
+            """Signal that data upload is complete for a job.
+
+            Args:
+                job_id: The ID of the ingest job.
+
+            """
+            await self._sf_bulk._make_request(  # noqa: SLF001
+                "PATCH",
+                f"ingest/{job_id}",
+                json={"state": "UploadComplete"},
+            )
+
+        async def abort(self, job_id: str) -> None:
+            """Abort an ingest job.
+
+            Records that Salesforce has already processed are not rolled back.
+
+            Args:
+                job_id: The ID of the ingest job.
+
+            """
+            await self._sf_bulk._make_request(  # noqa: SLF001
+                "PATCH",
+                f"ingest/{job_id}",
+                json={"state": "Aborted"},
+            )
+
+        async def get_info(self, job_id: str) -> dict[str, Any]:
+            """Get information about a specific ingest job.
+
+            Args:
+                job_id: The ID of the ingest job.
+
+            Returns:
+                A dictionary containing the job's information.
+
+            """
+            _response = await self._sf_bulk._make_request(  # noqa: SLF001
+                "GET",
+                f"ingest/{job_id}",
+            )
+            return cast("dict[str, Any]", load_json(_response.content))
+
+        async def wait(
+            self,
+            job_id: str,
+            interval: float | None = None,
+        ) -> dict[str, Any]:
+            """Wait an ingest job's status until it completes.
+
+            Args:
+                job_id: The ID of the ingest job to wait.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+
+            Returns:
+                The final job information dictionary after completion.
+
+            Raises:
+                TimeoutError: If the job does not finish within the timeout of
+                    the client's poll settings. Wrap the call in
+                    `asyncio.timeout()` for a per-call limit.
+
+            """
+            return await self._sf_bulk._wait_for_terminal(  # noqa: SLF001
+                self.get_info,
+                job_id,
+                interval,
+            )
+
+        async def wait_many(
+            self,
+            job_ids: list[str],
+            interval: float | None = None,
+            *,
+            max_concurrency: int = 20,
+        ) -> list[dict[str, Any]]:
+            """Wait several ingest jobs concurrently until they all complete.
+
+            Every job is polled in its own task, so the total wall time is that
+            of the slowest job rather than the sum over all jobs.
+
+            Args:
+                job_ids: The IDs of the ingest jobs to wait.
+                interval: A fixed waiting interval in seconds. If None,
+                    the client's backoff settings are used.
+                max_concurrency: The maximum number of status checks in
+                    flight at once.
+
+            Returns:
+                The final job information dictionaries, in the order of `job_ids`.
+
+            """
+            return await self._sf_bulk._wait_many(  # noqa: SLF001
+                self.get_info,
+                job_ids,
+                interval,
+                max_concurrency,
+            )
+
+        async def get_successful_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> ResultType:
+            """Get the successful records from a completed ingest job.
+
+            Args:
+                job_id: The ID of the ingest job.
+                format_type: The desired output format. Defaults to 'dict'.
+
+            Returns:
+                The query results in the specified format.
+
+            """
+            return await self._sf_bulk._get_csv_results(  # noqa: SLF001
+                f"ingest/{job_id}/successfulResults",
+                format_type,
+            )
+
+        async def get_failed_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> ResultType:
+            """Get the failed records from a completed ingest job.
+
+            Args:
+                job_id: The ID of the ingest job.
+                format_type: The desired output format. Defaults to 'dict'.
+
+            Returns:
+                The query results in the specified format.
+
+            """
+            return await self._sf_bulk._get_csv_results(  # noqa: SLF001
+                f"ingest/{job_id}/failedResults",
+                format_type,
+            )
+
+        async def get_unprocessed_records(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> ResultType:
+            """Get unprocessed records from an ingest job.
+
+            Args:
+                job_id: The ID of the ingest job.
+                format_type: The desired output format. Defaults to 'dict'.
+
+            Returns:
+                The query results in the specified format.
+
+            """
+            return await self._sf_bulk._get_csv_results(  # noqa: SLF001
+                f"ingest/{job_id}/unprocessedrecords",
+                format_type,
+            )
+
+        async def get_all_results(
+            self,
+            job_id: str,
+            format_type: FormatType = "dict",
+        ) -> dict[str, ResultType]:
+            """Get the successful, failed and unprocessed records concurrently.
+
+            Args:
+                job_id: The ID of the ingest job.
+                format_type: The desired output format. Defaults to 'dict'.
+
+            Returns:
+                A dictionary with the 'successful', 'failed' and 'unprocessed'
+                records in the specified format.
+
+            """
+            _successful, _failed, _unprocessed = await asyncio.gather(
+                self.get_successful_results(job_id, format_type),
+                self.get_failed_results(job_id, format_type),
+                self.get_unprocessed_records(job_id, format_type),
+            )
+            return {
+                "successful": _successful,
+                "failed": _failed,
+                "unprocessed": _unprocessed,
+            }
+
+    def __init__(
+        self: "AsyncSfBulk",
+        sf: Sf,
+        interval: int = 5,
+        timeout: int = 30,
+        *,
+        poll_settings: PollSettings | None = None,
+    ) -> None:
+        """Initialize the AsyncSfBulk client."""
+        try:
+            import httpx  # noqa: PLC0415
+        except ImportError as e:
+            error_msg = (
+                "AsyncSfBulk requires 'httpx'. "
+                "Install it with the 'async' extra of custom-simple-salesforce."
+            )
+            raise ImportError(error_msg) from e
+
+        self.bulk2_url = sf.bulk2_url
+        self.headers = bulk_headers(sf.headers)
+        self._interval = interval
+        self._poll_settings = poll_settings or PollSettings.from_env(
+            max_delay=interval * 6,
+        )
+        self._timeout = timeout
+
+        # One multiplexed HTTP/2 connection shared by every request
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+
+        # Instantiate nested handlers
+        self.query = self.Query(self)
+        self.ingest = self.Ingest(self)
+
+    async def __aenter__(self: "AsyncSfBulk") -> Self:
+        """Return the client itself for use as an async context manager."""
+        return self
+
+    async def __aexit__(
+        self: "AsyncSfBulk",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the connections when leaving the context."""
+        await self.aclose()
+
+    async def aclose(self: "AsyncSfBulk") -> None:
+        """Close the underlying HTTP client and release its connections."""
+        await self._client.aclose()
+
+    async def _make_request(
+        self: "AsyncSfBulk",
+        method: str,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> "httpx.Response":
+        """Send an API request and check its status (internal helper).
+
+        Rate-limited (HTTP 429) requests are retried after the `Retry-After`
+        delay.
+        """
+        _url = resolve_url(self.bulk2_url, endpoint)
+        _response = await self._client.request(method, _url, headers=headers, **kwargs)
+        _retries = 0
+        while (
+            _response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+            and _retries < MAX_RATE_LIMIT_RETRIES
+        ):
+            await asyncio.sleep(
+                retry_after_delay(
+                    _response.headers.get("Retry-After"),
+                    self._poll_settings.delay(_retries),
+                ),
+            )
+            _retries += 1
+            _response = await self._client.request(
+                method,
+                _url,
+                headers=headers,
+                **kwargs,
+            )
+        _response.raise_for_status()
+        return _response
+
+    async def _get_csv_results(
+        self,
+        endpoint: str,
+        format_type: FormatType,
+    ) -> ResultType:
+        """Retrieve and parse CSV results from a given endpoint (internal helper)."""
+        validate_format_type(format_type)
+
+        _response = await self._make_request("GET", endpoint)
+        if format_type in COLUMNAR_FORMATS:
+            return await asyncio.to_thread(
+                parse_columnar,
+                io.BytesIO(_response.content),
+                format_type,
+            )
+
+        _csv_data = _response.content.decode("utf-8")
+        if format_type == "csv":
+            return _csv_data
+
+        # Parse in a worker thread so a large result does not block the loop.
+        return await asyncio.to_thread(
+            parse_csv,
+            io.StringIO(_csv_data, newline=""),
+            format_type,
+        )
+
+    async def _wait_for_terminal(
+        self,
+        get_info: Callable[[str], Awaitable[dict[str, Any]]],
+        job_id: str,
+        interval: float | None,
+    ) -> dict[str, Any]:
+        """Poll a job until it reaches a terminal state (internal helper)."""
+        _timeout = self._poll_settings.timeout
+        _deadline = None if _timeout is None else monotonic() + _timeout
+        _attempt = 0
+        while True:
+            _job_info = await get_info(job_id)
+            if _job_info["state"] in TERMINAL_STATES:
+                return _job_info
+            _delay = (
+                interval
+                if interval is not None
+                else self._poll_settings.delay(_attempt)
+            )
+            if _deadline is not None:
+                _remaining = _deadline - monotonic()
+                if _remaining <= 0:
+                    error_msg = (
+                        f"Job {job_id} did not finish within {_timeout} seconds "
+                        f"(last state: {_job_info['state']})."
+                    )
+                    raise TimeoutError(error_msg)
+                _delay = min(_delay, _remaining)
+            await asyncio.sleep(_delay)
+            _attempt += 1
+
+    async def _wait_many(
+        self,
+        get_info: Callable[[str], Awaitable[dict[str, Any]]],
+        job_ids: list[str],
+        interval: float | None,
+        max_concurrency: int,
+    ) -> list[dict[str, Any]]:
+        """Poll several jobs in their own tasks (internal helper).
+
+        A semaphore bounds the status checks in flight, so hundreds of jobs
+        can be waited on one event loop without flooding the connection.
+        """
+        _semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _get_info(job_id: str) -> dict[str, Any]:
+            async with _semaphore:
+                return await get_info(job_id)
+
+        async with asyncio.TaskGroup() as task_group:
+            _tasks = [
+                task_group.create_task(
+                    self._wait_for_terminal(_get_info, _job_id, interval),
+                )
+                for _job_id in job_ids
+            ]
+        return [_task.result() for _task in _tasks]
+
+    async def create_job(
+        self: "AsyncSfBulk",
+        object_name: str,
+        operation: OperationType,
+        external_id_field: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a generic ingest job (internal helper)."""
+        if operation not in self._OPERATIONS:
+            error_msg = (
+                f"Unsupported operation: '{operation}'. "
+                f"Allowed operations are: {', '.join(sorted(self._OPERATIONS))}"
+            )
+            raise ValueError(error_msg)
+        if operation == "upsert" and not external_id_field:
+            error_msg = "The 'external_id_field' is required for 'upsert' operation."
+            raise ValueError(error_msg)
+
+        _payload = (
+            {
+                "object": object_name,
+                "operation": operation,
+                "externalIdFieldName": external_id_field,
+            }
+            if external_id_field
+            else {"object": object_name, "operation": operation}
+        )
+
+        _response = await self._make_request("POST", "ingest", json=_payload)
+        return cast("dict[str, Any]", load_json(_response.content))
+
+    async def run_ingest(  # noqa: PLR0913
+        self: "AsyncSfBulk",
+        object_name: str,
+        operation: OperationType,
+        batches: Iterable[str | bytes],
+        *,
+        external_id_field: str | None = None,
+        max_concurrent_jobs: int = 4,
+        format_type: FormatType = "dict",
+        interval: float | None = None,
+    ) -> AsyncIterator[tuple[dict[str, Any], dict[str, ResultType]]]:
+        """Run one ingest job per batch, pipelining the job phases.
+
+        Each batch goes through create, upload, complete, wait and result
+        download in its own task. Up to `max_concurrent_jobs` batches are in
+        flight at once, so one batch can upload while others are being
+        processed by Salesforce or downloading their results. Batches are read
+        from `batches` only as slots become free.
+
+        If a job fails or the caller stops iterating early, the jobs that are
+        still being uploaded or processed are cancelled and aborted.
+
+        Args:
+            object_name: The Salesforce object API name (e.g., 'Account').
+            operation: The ingest operation (e.g., 'insert', 'upsert').
+            batches: The CSV data of each job, each with its own header row.
+            external_id_field: The API name of the external ID field
+                (required for 'upsert').
+            max_concurrent_jobs: The maximum number of jobs in flight.
+            format_type: The desired output format of the results.
+            interval: A fixed waiting interval in seconds. If None,
+                the client's backoff settings are used.
+
+        Yields:
+            For each batch, in input order, the final job information and the
+            results returned by `Ingest.get_all_results`.
+
+        """
+        _semaphore = asyncio.Semaphore(max_concurrent_jobs)
+        # Jobs created but not yet processed, to abort if the run is stopped.
+        _unfinished: set[str] = set()
+
+        async def _run_job(
+            batch: str | bytes,
+        ) -> tuple[dict[str, Any], dict[str, ResultType]]:
+            try:
+                _job_id = (
+                    await self.create_job(object_name, operation, external_id_field)
+                )["id"]
+                _unfinished.add(_job_id)
+                await self.ingest.upload_and_complete(_job_id, batch)
+                _job_info = await self.ingest.wait(_job_id, interval)
+                _unfinished.discard(_job_id)
+                return _job_info, await self.ingest.get_all_results(
+                    _job_id,
+                    format_type,
+                )
+            finally:
+                _semaphore.release()
+
+        _pending: deque[asyncio.Task[tuple[dict[str, Any], dict[str, ResultType]]]] = (
+            deque()
+        )
+        try:
+            for _batch in batches:
+                await _semaphore.acquire()
+                _pending.append(asyncio.create_task(_run_job(_batch)))
+                while _pending and _pending[0].done():
+                    yield _pending.popleft().result()
+            while _pending:
+                yield await _pending.popleft()
+        finally:
+            # Stop the remaining jobs if the caller stops early or a job failed.
+            for _task in _pending:
+                _task.cancel()
+            await asyncio.gather(*_pending, return_exceptions=True)
+            if _unfinished:
+                import httpx  # noqa: PLC0415
+
+                for _job_id in _unfinished:
+                    with suppress(httpx.HTTPError):
+                        await self.ingest.abort(_job_id)
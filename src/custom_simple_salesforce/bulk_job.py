@@ -5,9 +5,15 @@ including query jobs and DML operation jobs. These classes act as wrappers
 around a bulk client instance to simplify job-specific operations.
 """
 
-from typing import TYPE_CHECKING, Any
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+from typing import IO, TYPE_CHECKING, Any
 
-from .types import FormatType, ResultType
+from .polling import TERMINAL_STATES
+from .results import ResultStream, merge_results
+from .types import FormatType, ResultType, UploadDataType
 
 if TYPE_CHECKING:
     from .bulk import SfBulk
@@ -20,9 +26,12 @@ class _SfBulkJobBase:
     It is not intended to be instantiated directly.
     """
 
+    __slots__ = ("_results_cache", "_sf_bulk", "id", "info")
+
     _sf_bulk: "SfBulk"
     id: str
-    _info: dict[str, Any]
+    info: dict[str, Any]
+    _results_cache: dict[tuple[str, FormatType], ResultType]
 
     def __init__(
         self: "_SfBulkJobBase",
@@ -38,17 +47,50 @@ class _SfBulkJobBase:
         """
         self._sf_bulk = sf_bulk
         self.id = job_info["id"]
-        self._info = job_info
+        self._set_info(job_info)
+        self._results_cache = {}
+
+    def _set_info(self: "_SfBulkJobBase", job_info: dict[str, Any]) -> None:
+        """Store the latest job information (internal helper).
+
+        The failed record count is stored as an int, as it may be reported as
+        a string.
+        """
+        if job_info.get("numberRecordsFailed") is not None:
+            job_info["numberRecordsFailed"] = int(job_info["numberRecordsFailed"])
+        self.info = job_info
 
     @property
-    def info(self: "_SfBulkJobBase") -> dict[str, Any]:
-        """Get the last known job information (read-only).
+    def state(self: "_SfBulkJobBase") -> str:
+        """Get the last known job state (e.g., 'InProgress', 'JobComplete')."""
+        return self.info.get("state", "")
+
+    def is_terminal(self: "_SfBulkJobBase") -> bool:
+        """Check if the job has reached a terminal state.
+
+        The terminal states are 'JobComplete', 'Aborted', or 'Failed'. The
+        information of a finished job never changes again, so it is served
+        from memory instead of being fetched.
+
+        Returns:
+            True if the last known state is terminal, False otherwise.
 
-        This property provides access to the job's state as of the last update
-        (e.g., after initialization, `get_info()`, or `wait()`).
-        To fetch the latest status from Salesforce, use the `get_info()` method.
         """
-        return self._info
+        return self.info.get("state") in TERMINAL_STATES
+
+    def _cached_results(
+        self: "_SfBulkJobBase",
+        kind: str,
+        format_type: FormatType,
+        fetch: Callable[[], ResultType],
+    ) -> ResultType:
+        """Fetch results once the job is finished and reuse them (internal helper)."""
+        if not self.is_terminal():
+            return fetch()
+        _key = (kind, format_type)
+        if _key not in self._results_cache:
+            self._results_cache[_key] = fetch()
+        return self._results_cache[_key]
 
 
 class SfBulkJobQuery(_SfBulkJobBase):
@@ -69,49 +111,111 @@ class SfBulkJobQuery(_SfBulkJobBase):
 
     """
 
+    __slots__ = ("_query",)
+
+    _query: "SfBulk.Query"
+
+    def __init__(
+        self: "SfBulkJobQuery",
+        sf_bulk: "SfBulk",
+        job_info: dict[str, Any],
+    ) -> None:
+        """Initialize the job and keep the client's query handler."""
+        super().__init__(sf_bulk, job_info)
+        self._query = sf_bulk.query
+
     def get_info(self: "SfBulkJobQuery") -> dict[str, Any]:
         """Fetch the latest job information from Salesforce.
 
-        Updates `self.info` with the latest status.
+        Updates `self.info` with the latest status. Once the job has reached
+        a terminal state, its information is final and no request is sent.
 
         Returns:
             The latest job information dictionary.
 
         """
-        self._info = self._sf_bulk.query.get_info(self.id)
-        return self._info
+        if not self.is_terminal():
+            self._set_info(self._query.get_info(self.id))
+        return self.info
 
-    def wait(self: "SfBulkJobQuery", interval: int | None = None) -> dict[str, Any]:
+    def wait(
+        self: "SfBulkJobQuery",
+        interval: float | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
         """Wait the job status until it reaches a terminal state.
 
         The terminal states are 'JobComplete', 'Aborted', or 'Failed'.
         Updates `self.info` with the final job status.
 
         Args:
-            interval: The waiting interval in seconds. If None,
-                the client's default is used.
+            interval: A fixed waiting interval in seconds. If None,
+                the client's backoff settings are used.
+            timeout: The maximum waiting time in seconds. If None, the
+                timeout of the client's poll settings is used.
 
         Returns:
             The final job information dictionary.
 
+        Raises:
+            TimeoutError: If the job does not finish within the timeout.
+
         """
-        self._info = self._sf_bulk.query.wait(self.id, interval=interval)
-        return self._info
+        if self.is_terminal():
+            return self.info
+        self._set_info(
+            self._query.wait(self.id, interval=interval, timeout=timeout),
+        )
+        return self.info
 
     def get_results(
         self: "SfBulkJobQuery",
         format_type: FormatType = "dict",
+        *,
+        parallel: int = 1,
     ) -> ResultType:
         """Get the job results in the specified format.
 
         Args:
             format_type: The desired output format.
+            parallel: The number of result pages to download concurrently.
 
         Returns:
             The query results.
 
         """
-        return self._sf_bulk.query.get_results(self.id, format_type=format_type)
+        return self._query.get_results(
+            self.id,
+            format_type=format_type,
+            parallel=parallel,
+        )
+
+    def iter_results(
+        self: "SfBulkJobQuery",
+        format_type: FormatType = "dict",
+    ) -> ResultStream:
+        """Stream the job results row by row.
+
+        Args:
+            format_type: The desired row format, 'dict' or 'reader'.
+
+        Returns:
+            A closable iterator over the result rows.
+
+        """
+        return self._query.iter_results(self.id, format_type=format_type)
+
+    def download_results(self: "SfBulkJobQuery", file: IO[bytes]) -> int:
+        """Write the raw CSV results to a binary file.
+
+        Args:
+            file: A binary file-like object to write the CSV data to.
+
+        Returns:
+            The number of bytes written.
+
+        """
+        return self._query.download_results(self.id, file)
 
 
 class SfBulkJob(_SfBulkJobBase):
@@ -120,6 +224,9 @@ class SfBulkJob(_SfBulkJobBase):
     Supports uploading CSV data, marking the upload as complete, waiting its status, and
     retrieving successful or failed records.
 
+    Once the job has reached a terminal state, each kind of result is
+    downloaded only once per format; later calls return the same object.
+
     Attributes:
         _sf_bulk (SfBulk): The Bulk API client instance used for API communication.
         id (str): The unique ID for the Bulk API job.
@@ -132,14 +239,77 @@ class SfBulkJob(_SfBulkJobBase):
 
     """
 
-    def upload_data(self: "SfBulkJob", csv_data: str) -> None:
+    __slots__ = ("_ingest",)
+
+    _ingest: "SfBulk.Ingest"
+
+    def __init__(
+        self: "SfBulkJob",
+        sf_bulk: "SfBulk",
+        job_info: dict[str, Any],
+    ) -> None:
+        """Initialize the job and keep the client's ingest handler."""
+        super().__init__(sf_bulk, job_info)
+        self._ingest = sf_bulk.ingest
+
+    def upload_data(
+        self: "SfBulkJob",
+        csv_data: UploadDataType,
+        *,
+        compress: bool = False,
+    ) -> None:
         """Upload CSV data to the job.
 
         Args:
-            csv_data: A string containing the data in CSV format.
+            csv_data: The data in CSV format, as a string, UTF-8 bytes,
+                a file path, a binary file-like object, or an iterable of
+                UTF-8 byte chunks.
+            compress: If True, the body is sent gzip-compressed.
 
         """
-        self._sf_bulk.ingest.upload_data(job_id=self.id, csv_data=csv_data)
+        self._ingest.upload_data(
+            job_id=self.id,
+            csv_data=csv_data,
+            compress=compress,
+        )
+
+    def upload_file(
+        self: "SfBulkJob",
+        path: str | os.PathLike[str],
+        *,
+        compress: bool = False,
+    ) -> None:
+        """Upload a CSV file to the job, streaming it from disk.
+
+        Args:
+            path: The path to a UTF-8 encoded CSV file.
+            compress: If True, the file is sent gzip-compressed.
+
+        """
+        self._ingest.upload_file(
+            job_id=self.id,
+            path=path,
+            compress=compress,
+        )
+
+    def upload_and_complete(
+        self: "SfBulkJob",
+        csv_data: UploadDataType,
+        *,
+        compress: bool = False,
+    ) -> None:
+        """Upload CSV data to the job and mark the upload as complete.
+
+        Args:
+            csv_data: The data in CSV format (see `upload_data`).
+            compress: If True, the body is sent gzip-compressed.
+
+        """
+        self._ingest.upload_and_complete(
+            job_id=self.id,
+            csv_data=csv_data,
+            compress=compress,
+        )
 
     def complete_upload(
         self: "SfBulkJob",
@@ -149,36 +319,113 @@ class SfBulkJob(_SfBulkJobBase):
         This signals to Salesforce that all data has been uploaded and the job
         is ready for processing (transitions to 'UploadComplete' state).
         """
-        self._sf_bulk.ingest.complete_upload(job_id=self.id)
+        self._ingest.complete_upload(job_id=self.id)
 
     def get_info(self: "SfBulkJob") -> dict[str, Any]:
         """Fetch the latest job information from Salesforce.
 
-        Updates `self.info` with the latest status.
+        Updates `self.info` with the latest status. Once the job has reached
+        a terminal state, its information is final and no request is sent.
 
         Returns:
             The latest job information dictionary.
 
         """
-        self._info = self._sf_bulk.ingest.get_info(job_id=self.id)
-        return self._info
+        if not self.is_terminal():
+            self._set_info(self._ingest.get_info(job_id=self.id))
+        return self.info
 
-    def wait(self: "SfBulkJob", interval: int | None = None) -> dict[str, Any]:
+    def wait(
+        self: "SfBulkJob",
+        interval: float | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
         """Wait the job status until it reaches a terminal state.
 
         The terminal states are 'JobComplete', 'Aborted', or 'Failed'.
         Updates `self.info` with the final job status.
 
         Args:
-            interval: The waiting interval in seconds. If None,
-                the client's default is used.
+            interval: A fixed waiting interval in seconds. If None,
+                the client's backoff settings are used.
+            timeout: The maximum waiting time in seconds. If None, the
+                timeout of the client's poll settings is used.
 
         Returns:
             The final job information dictionary.
 
+        Raises:
+            TimeoutError: If the job does not finish within the timeout.
+
+        """
+        if self.is_terminal():
+            return self.info
+        self._set_info(
+            self._ingest.wait(
+                job_id=self.id,
+                interval=interval,
+                timeout=timeout,
+            ),
+        )
+        return self.info
+
+    @classmethod
+    def wait_many(
+        cls: type["SfBulkJob"],
+        jobs: list["SfBulkJob"],
+        interval: float | None = None,
+        timeout: float | None = None,
+        *,
+        max_workers: int = 8,
+    ) -> list[dict[str, Any]]:
+        """Wait several jobs together until they all reach a terminal state.
+
+        On each poll cycle the jobs that are still running are checked in
+        parallel over the client's connection pool, so a cycle takes about one
+        round trip instead of one per job. The backoff between cycles follows
+        the settings of the first job's client. Updates `info` of every job.
+
+        Args:
+            jobs: The jobs to wait.
+            interval: A fixed waiting interval in seconds. If None,
+                the client's backoff settings are used.
+            timeout: The maximum total waiting time in seconds. If None, the
+                timeout of the client's poll settings is used.
+            max_workers: The maximum number of concurrent status checks.
+
+        Returns:
+            The final job information dictionaries, in the order of `jobs`.
+
+        Raises:
+            TimeoutError: If a job does not finish within the timeout.
+
         """
-        self._info = self._sf_bulk.ingest.wait(job_id=self.id, interval=interval)
-        return self._info
+        if not jobs:
+            return []
+
+        _sf_bulk = jobs[0]._sf_bulk  # noqa: SLF001
+        if timeout is None:
+            timeout = _sf_bulk._poll_settings.timeout  # noqa: SLF001
+        _deadline = None if timeout is None else monotonic() + timeout
+        _attempt = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            while _running := [_job for _job in jobs if not _job.is_terminal()]:
+                list(executor.map(cls.get_info, _running))
+                if all(_job.is_terminal() for _job in _running):
+                    break
+                _delay = _sf_bulk._get_delay(_attempt, interval)  # noqa: SLF001
+                if _deadline is not None:
+                    _remaining = _deadline - monotonic()
+                    if _remaining <= 0:
+                        error_msg = (
+                            f"{len(_running)} job(s) did not finish within "
+                            f"{timeout} seconds."
+                        )
+                        raise TimeoutError(error_msg)
+                    _delay = min(_delay, _remaining)
+                sleep(_delay)
+                _attempt += 1
+        return [_job.info for _job in jobs]
 
     def is_successful(self: "SfBulkJob") -> bool:
         """Check if the job completed successfully.
@@ -187,7 +434,7 @@ class SfBulkJob(_SfBulkJobBase):
             True if the job state is 'JobComplete', False otherwise.
 
         """
-        return self.info.get("state") == "JobComplete"
+        return self.state == "JobComplete"
 
     def has_failed_records(self: "SfBulkJob") -> bool:
         """Check if the job has any failed records.
@@ -196,7 +443,8 @@ class SfBulkJob(_SfBulkJobBase):
             True if the number of failed records is greater than 0.
 
         """
-        return int(self.info.get("numberRecordsFailed", 0)) > 0
+        # The count is null before processing; _set_info stores it as an int.
+        return (self.info.get("numberRecordsFailed") or 0) > 0
 
     def is_failed(self: "SfBulkJob") -> bool:
         """Check if the entire job failed.
@@ -205,7 +453,7 @@ class SfBulkJob(_SfBulkJobBase):
             True if the job state is 'Failed', False otherwise.
 
         """
-        return self.info.get("state") == "Failed"
+        return self.state == "Failed"
 
     def is_aborted(self: "SfBulkJob") -> bool:
         """Check if the job was aborted.
@@ -214,7 +462,7 @@ class SfBulkJob(_SfBulkJobBase):
             True if the job state is 'Aborted', False otherwise.
 
         """
-        return self.info.get("state") == "Aborted"
+        return self.state == "Aborted"
 
     def get_successful_results(
         self: "SfBulkJob",
@@ -229,9 +477,13 @@ class SfBulkJob(_SfBulkJobBase):
             The successful records in the specified format.
 
         """
-        return self._sf_bulk.ingest.get_successful_results(
-            job_id=self.id,
-            format_type=format_type,
+        return self._cached_results(
+            "successful",
+            format_type,
+            lambda: self._ingest.get_successful_results(
+                job_id=self.id,
+                format_type=format_type,
+            ),
         )
 
     def get_failed_results(
@@ -249,9 +501,13 @@ class SfBulkJob(_SfBulkJobBase):
             The failed records in the specified format.
 
         """
-        return self._sf_bulk.ingest.get_failed_results(
-            job_id=self.id,
-            format_type=format_type,
+        return self._cached_results(
+            "failed",
+            format_type,
+            lambda: self._ingest.get_failed_results(
+                job_id=self.id,
+                format_type=format_type,
+            ),
         )
 
     def get_unprocessed_records(
@@ -270,7 +526,196 @@ class SfBulkJob(_SfBulkJobBase):
             The unprocessed records in the specified format.
 
         """
-        return self._sf_bulk.ingest.get_unprocessed_records(
-            job_id=self.id,
-            format_type=format_type,
+        return self._cached_results(
+            "unprocessed",
+            format_type,
+            lambda: self._ingest.get_unprocessed_records(
+                job_id=self.id,
+                format_type=format_type,
+            ),
         )
+
+    def get_all_results(
+        self: "SfBulkJob",
+        format_type: FormatType = "dict",
+    ) -> dict[str, ResultType]:
+        """Get the successful, failed and unprocessed records at once.
+
+        The three result downloads are fetched concurrently. Results already
+        downloaded for a finished job are reused.
+
+        Args:
+            format_type: The desired output format.
+
+        Returns:
+            A dictionary with the 'successful', 'failed' and 'unprocessed'
+            records in the specified format.
+
+        """
+        _kinds = ("successful", "failed", "unprocessed")
+        _cached = self.is_terminal() and all(
+            (_kind, format_type) in self._results_cache for _kind in _kinds
+        )
+        if not _cached:
+            _results = self._ingest.get_all_results(
+                job_id=self.id,
+                format_type=format_type,
+            )
+            if not self.is_terminal():
+                return _results
+            for _kind, _result in _results.items():
+                self._results_cache.setdefault((_kind, format_type), _result)
+        return {_kind: self._results_cache[_kind, format_type] for _kind in _kinds}
+
+
+class SfBulkCompositeJob:
+    """Manage several Salesforce Bulk API DML jobs as a single unit.
+
+    This is returned when one ingest is split into multiple jobs that run in
+    parallel. Results from the child jobs are merged in job order.
+
+    Attributes:
+        jobs (list[SfBulkJob]): The child jobs, in the order of the input data.
+
+    Args:
+        jobs (list[SfBulkJob]): The child jobs to manage.
+
+    """
+
+    __slots__ = ("jobs",)
+
+    jobs: list[SfBulkJob]
+
+    def __init__(self: "SfBulkCompositeJob", jobs: list[SfBulkJob]) -> None:
+        """Initialize the composite job."""
+        self.jobs = jobs
+
+    @property
+    def info(self: "SfBulkCompositeJob") -> list[dict[str, Any]]:
+        """Get the last known information of every child job (read-only)."""
+        return [_job.info for _job in self.jobs]
+
+    def wait(
+        self: "SfBulkCompositeJob",
+        interval: float | None = None,
+        timeout: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Wait until every child job reaches a terminal state.
+
+        The child jobs are polled together (see `SfBulkJob.wait_many`).
+
+        Args:
+            interval: A fixed waiting interval in seconds. If None,
+                the client's backoff settings are used.
+            timeout: The maximum total waiting time in seconds. If None, the
+                timeout of the client's poll settings is used.
+
+        Returns:
+            The final job information dictionaries.
+
+        Raises:
+            TimeoutError: If a job does not finish within the timeout.
+
+        """
+        return SfBulkJob.wait_many(self.jobs, interval=interval, timeout=timeout)
+
+    def is_terminal(self: "SfBulkCompositeJob") -> bool:
+        """Check if every child job has reached a terminal state.
+
+        Returns:
+            True if all job states are terminal, False otherwise.
+
+        """
+        return all(_job.is_terminal() for _job in self.jobs)
+
+    def is_successful(self: "SfBulkCompositeJob") -> bool:
+        """Check if every child job completed successfully.
+
+        Returns:
+            True if all job states are 'JobComplete', False otherwise.
+
+        """
+        return all(_job.is_successful() for _job in self.jobs)
+
+    def has_failed_records(self: "SfBulkCompositeJob") -> bool:
+        """Check if any child job has failed records.
+
+        Returns:
+            True if at least one job has failed records.
+
+        """
+        return any(_job.has_failed_records() for _job in self.jobs)
+
+    def get_successful_results(
+        self: "SfBulkCompositeJob",
+        format_type: FormatType = "dict",
+    ) -> ResultType:
+        """Get the successfully processed records of all child jobs.
+
+        Args:
+            format_type: The desired output format.
+
+        Returns:
+            The successful records in the specified format.
+
+        """
+        return merge_results(
+            [_job.get_successful_results(format_type) for _job in self.jobs],
+            format_type,
+        )
+
+    def get_failed_results(
+        self: "SfBulkCompositeJob",
+        format_type: FormatType = "dict",
+    ) -> ResultType:
+        """Get the records that failed to process in any child job.
+
+        Args:
+            format_type: The desired output format.
+
+        Returns:
+            The failed records in the specified format.
+
+        """
+        return merge_results(
+            [_job.get_failed_results(format_type) for _job in self.jobs],
+            format_type,
+        )
+
+    def get_unprocessed_records(
+        self: "SfBulkCompositeJob",
+        format_type: FormatType = "dict",
+    ) -> ResultType:
+        """Get records that were not processed by any child job.
+
+        Args:
+            format_type: The desired output format.
+
+        Returns:
+            The unprocessed records in the specified format.
+
+        """
+        return merge_results(
+            [_job.get_unprocessed_records(format_type) for _job in self.jobs],
+            format_type,
+        )
+
+    def get_all_results(
+        self: "SfBulkCompositeJob",
+        format_type: FormatType = "dict",
+    ) -> dict[str, ResultType]:
+        """Get the successful, failed and unprocessed records of all child jobs.
+
+        Args:
+            format_type: The desired output format.
+
+        Returns:
+            A dictionary with the 'successful', 'failed' and 'unprocessed'
+            records in the specified format.
+
+        """
+        _results = [_job.get_all_results(format_type) for _job in self.jobs]
+        return {
+            _kind: merge_results([_result[_kind] for _result in _results], format_type)
+            for _kind in ("successful", "failed", "unprocessed")
+        }
@@ -5,13 +5,41 @@ easier to manage connection settings. It extends the `simple-salesforce` library
 provide more flexible connection options.
 """
 
+import hashlib
+import json
+import threading
+import time
 from typing import Any, Literal
 
 import requests
-import yaml
-from pydantic import BaseModel, SecretStr, ValidationError
+from pydantic import BaseModel, SecretStr, TypeAdapter
+from requests.adapters import HTTPAdapter
 from simple_salesforce.api import Salesforce
 
+_ENDPOINT_BY_DOMAIN = {
+    "login": "https://login.salesforce.com",
+    "test": "https://test.salesforce.com",
+}
+
+# Access tokens issued by the client credentials flow, keyed by
+# (endpoint, client_id, sha256 of client_secret) and stored as
+# (access_token, instance_url, expires_at on the monotonic clock).
+_TOKEN_CACHE: dict[tuple[str, str, str], tuple[str, str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+# Used when the token response has no `expires_in`; conservative default
+# matching the standard 2-hour session timeout.
+_TOKEN_LIFETIME = 2 * 60 * 60
+_TOKEN_EXPIRY_MARGIN = 60
+
+# Keep-alive session for token requests, so reconnecting to the same login
+# endpoint skips the TCP and TLS handshakes.
+_TOKEN_SESSION = requests.Session()
+_TOKEN_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16),
+)
+_TOKEN_SESSION.headers["Content-Type"] = "application/x-www-form-urlencoded"
+
 
 class SalesforceBaseSettings(BaseModel):  # noqa: D101
     auth_method: Literal["password", "client_credentials"]
@@ -35,6 +63,11 @@ class ClientCredentialsSettings(SalesforceBaseSettings):
     domain: str = "login"
 
 
+# Validators are built once at import and reused by every connection.
+_PASSWORD_VALIDATOR = TypeAdapter(PasswordAuthSettings)
+_CLIENT_CREDENTIALS_VALIDATOR = TypeAdapter(ClientCredentialsSettings)
+
+
 class Sf(Salesforce):
     """Provide a Salesforce client.
 
@@ -55,12 +88,10 @@ class Sf(Salesforce):
     def _connect_with_password(cls: type["Sf"], config: dict[str, Any]) -> "Sf":
         """Connect to Salesforce using password authentication."""
         try:
-            validated_settings = PasswordAuthSettings.model_validate(config)
-        except ValidationError as e:
-            error_msg = f"Failed to validate Salesforce settings: {e}"
-            raise ValueError(error_msg) from e
+            validated_settings = _PASSWORD_VALIDATOR.validate_python(config)
         except (ValueError, TypeError) as e:
-            error_msg = f"An unexpected error occurred during settings parsing: {e}"
+            # pydantic.ValidationError is a subclass of ValueError.
+            error_msg = f"Failed to validate Salesforce settings: {e}"
             raise ValueError(error_msg) from e
 
         return cls(
@@ -78,43 +109,78 @@ class Sf(Salesforce):
     ) -> "Sf":
         """Connect to Salesforce using client credentials authentication."""
         try:
-            validated_settings = ClientCredentialsSettings.model_validate(
+            validated_settings = _CLIENT_CREDENTIALS_VALIDATOR.validate_python(
                 config,
             )
-        except ValidationError as e:
-            error_msg = f"Failed to validate Salesforce settings: {e}"
-            raise ValueError(error_msg) from e
         except (ValueError, TypeError) as e:
-            error_msg = f"An unexpected error occurred during settings parsing: {e}"
+            # pydantic.ValidationError is a subclass of ValueError.
+            error_msg = f"Failed to validate Salesforce settings: {e}"
             raise ValueError(error_msg) from e
 
-        match validated_settings.domain:
-            case "login":
-                _endpoint = "https://login.salesforce.com"
-            case "test":
-                _endpoint = "https://test.salesforce.com"
-            case _:
-                _endpoint = f"https://{validated_settings.domain}.my.salesforce.com"
+        _domain = validated_settings.domain
+        _endpoint = (
+            _ENDPOINT_BY_DOMAIN.get(_domain) or f"https://{_domain}.my.salesforce.com"
+        )
+
+        _client_secret = validated_settings.client_secret.get_secret_value()
+        _cache_key = (
+            _endpoint,
+            validated_settings.client_id,
+            hashlib.sha256(_client_secret.encode("utf-8")).hexdigest(),
+        )
+        with _TOKEN_CACHE_LOCK:
+            _cached = _TOKEN_CACHE.get(_cache_key)
+        if _cached and time.monotonic() < _cached[2] - _TOKEN_EXPIRY_MARGIN:
+            return cls(
+                instance_url=_cached[1],
+                session_id=_cached[0],
+                version=validated_settings.api_version,
+            )
 
-        _response = requests.post(
+        _response = _TOKEN_SESSION.post(
             f"{_endpoint}/services/oauth2/token",
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
             data={
                 "grant_type": "client_credentials",
                 "client_id": validated_settings.client_id,
-                "client_secret": validated_settings.client_secret.get_secret_value(),
+                "client_secret": _client_secret,
             },
             timeout=30,
         )
         _response.raise_for_status()
 
         _response_json = _response.json() or {}
+        _access_token = _response_json.get("access_token")
+        _instance_url = _response_json.get("instance_url")
+        if _access_token and _instance_url:
+            try:
+                _lifetime = float(_response_json.get("expires_in") or _TOKEN_LIFETIME)
+            except (TypeError, ValueError):
+                _lifetime = _TOKEN_LIFETIME
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[_cache_key] = (
+                    _access_token,
+                    _instance_url,
+                    time.monotonic() + _lifetime,
+                )
+
         return cls(
-            instance_url=_response_json.get("instance_url"),
-            session_id=_response_json.get("access_token"),
+            instance_url=_instance_url,
+            session_id=_access_token,
             version=validated_settings.api_version,
         )
 
+    @classmethod
+    def invalidate_token_cache(cls: type["Sf"]) -> None:
+        """Discard every cached client credentials access token.
+
+        `connection` reuses access tokens issued by the client credentials flow
+        until they are about to expire. Call this when a request fails with
+        HTTP 401 (e.g., the session was revoked) to force a new token on the
+        next connection.
+        """
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE.clear()
+
     @classmethod
     def connection(cls: type["Sf"], settings: str | dict[str, Any]) -> "Sf":
         """Establish a connection to Salesforce based on provided settings.
@@ -137,7 +203,8 @@ class Sf(Salesforce):
                 the authentication method is not supported.
 
             TypeError:
-                If the settings are not a dictionary or a string.
+                If the settings are not a dictionary or a string, or if the
+                settings string does not describe a mapping.
 
             yaml.YAMLError:
                 If the settings string is not a valid YAML format.
@@ -148,18 +215,20 @@ class Sf(Salesforce):
         """
         config: dict[str, Any]
         if isinstance(settings, str):
-            try:
-                config = yaml.safe_load(settings) or {}
-            except yaml.YAMLError as e:
-                error_msg = f"Invalid settings string format: {e}"
-                raise ValueError(error_msg) from e
+            _loaded = _load_settings_string(settings)
+            if not isinstance(_loaded, dict):
+                error_msg = "Settings string must describe a mapping of settings."
+                raise TypeError(error_msg)
+            config = _loaded
         elif isinstance(settings, dict):
             config = settings
         else:
             error_msg = "Settings must be provided as a JSON string or a dictionary."
             raise TypeError(error_msg)
 
-        config = {k.lower(): v for k, v in config.items()}
+        # Settings keys are usually lowercase already; only rebuild when needed.
+        if any(k != k.lower() for k in config):
+            config = {k.lower(): v for k, v in config.items()}
 
         auth_method = config.get("auth_method")
 
@@ -172,3 +241,28 @@ class Sf(Salesforce):
             case _:
                 error_msg = f"Unexpected authentication method specified: {auth_method}"
                 raise ValueError(error_msg)
+
+
+def _load_settings_string(settings: str) -> Any:  # noqa: ANN401
+    """Parse a JSON or YAML settings string (internal helper).
+
+    Strict JSON objects are parsed with `json`, which is much faster than
+    PyYAML; anything else falls back to the YAML loader. PyYAML is imported
+    only when a settings string is not JSON.
+    """
+    _stripped = settings.lstrip()
+    if _stripped.startswith("{"):
+        try:
+            return json.loads(_stripped)
+        except json.JSONDecodeError:
+            pass
+
+    import yaml  # noqa: PLC0415
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    _loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(settings, Loader=_loader)  # noqa: S506
+    except yaml.YAMLError as e:
+        error_msg = f"Invalid settings string format: {e}"
+        raise ValueError(error_msg) from e
@@ -0,0 +1,133 @@
+"""Shared polling primitives for Salesforce Bulk API 2.0 jobs.
+
+Both the synchronous and the asynchronous Bulk clients wait for jobs by
+checking their state repeatedly. This module holds the terminal-state set, the
+backoff schedule they share, and the parsing of `Retry-After` headers sent with
+rate-limited (HTTP 429) responses.
+"""
+
+import math
+import os
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+TERMINAL_STATES = frozenset({"Aborted", "JobComplete", "Failed"})
+"""Job states after which the state of a Bulk API job no longer changes."""
+
+MAX_RATE_LIMIT_RETRIES = 3
+"""How many times a rate-limited (HTTP 429) request is retried."""
+
+
+@dataclass(frozen=True, slots=True)
+class PollSettings:
+    """Define the backoff schedule used while waiting for a job.
+
+    The n-th delay (starting at 0) is `min(max_delay, min_delay * multiplier**n)`
+    plus a random jitter of up to `jitter` times that delay, so that many jobs
+    polled together do not hit the API at the same instant.
+
+    Attributes:
+        min_delay (float): The first delay in seconds.
+        max_delay (float): The maximum delay in seconds, before jitter.
+        multiplier (float): The growth factor applied after each check.
+        jitter (float): The maximum jitter as a fraction of the delay.
+        timeout (float | None): The maximum total waiting time in seconds.
+            None waits indefinitely.
+
+    """
+
+    min_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.25
+    timeout: float | None = None
+
+    @classmethod
+    def from_env(cls, *, max_delay: float | None = None) -> "PollSettings":
+        """Build settings from environment variables.
+
+        `SF_BULK_POLL_INTERVAL`, `SF_BULK_POLL_MAX` and `SF_BULK_POLL_TIMEOUT`
+        set `min_delay`, `max_delay` and `timeout` (in seconds). Unset
+        variables keep the defaults.
+
+        Args:
+            max_delay: The maximum delay to use when `SF_BULK_POLL_MAX` is
+                not set. Defaults to the class default.
+
+        Returns:
+            The poll settings.
+
+        """
+        _defaults = cls() if max_delay is None else cls(max_delay=max_delay)
+        return cls(
+            min_delay=_env_seconds("SF_BULK_POLL_INTERVAL") or _defaults.min_delay,
+            max_delay=_env_seconds("SF_BULK_POLL_MAX") or _defaults.max_delay,
+            multiplier=_defaults.multiplier,
+            jitter=_defaults.jitter,
+            timeout=_env_seconds("SF_BULK_POLL_TIMEOUT"),
+        )
+
+    def delay(self, attempt: int) -> float:
+        """Compute the delay before the next status check.
+
+        Args:
+            attempt: The number of status checks already made (starting at 0).
+
+        Returns:
+            The delay in seconds.
+
+        """
+        if self.multiplier > 1:
+            # Stop growing once the ceiling is reached, so that the power never
+            # overflows however long a job is waited for.
+            _growth = (
+                math.ceil(math.log(self.max_delay / self.min_delay, self.multiplier))
+                if 0 < self.min_delay < self.max_delay
+                else 0
+            )
+            attempt = min(attempt, _growth)
+        _delay = min(self.max_delay, self.min_delay * self.multiplier**attempt)
+        return _delay + random.uniform(0, self.jitter * _delay)  # noqa: S311
+
+
+def _env_seconds(name: str) -> float | None:
+    """Read a positive number of seconds from the environment (internal helper)."""
+    _value = os.environ.get(name)
+    if not _value:
+        return None
+    try:
+        _seconds = float(_value)
+    except ValueError as e:
+        error_msg = f"{name} must be a number of seconds, got '{_value}'."
+        raise ValueError(error_msg) from e
+    if _seconds <= 0:
+        error_msg = f"{name} must be positive, got '{_value}'."
+        raise ValueError(error_msg)
+    return _seconds
+
+
+def retry_after_delay(retry_after: str | None, fallback: float) -> float:
+    """Convert a `Retry-After` header value into a delay in seconds.
+
+    Args:
+        retry_after: The header value, either a number of seconds or an
+            HTTP date. None if the header was not sent.
+        fallback: The delay to use when the header is missing or invalid.
+
+    Returns:
+        The delay in seconds (never negative).
+
+    """
+    if not retry_after:
+        return fallback
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        _retry_at = parsedate_to_datetime(retry_after).timestamp()
+    except (TypeError, ValueError):
+        return fallback
+    return max(0.0, _retry_at - time.time())
@@ -0,0 +1,305 @@
+"""Helpers for parsing and combining Salesforce Bulk API 2.0 responses.
+
+Bulk API 2.0 returns results as independent CSV documents (one per result
+page or one per job), each with its own header row. This module parses them
+into the requested format and merges them into a single result. It also
+decodes the JSON bodies of job information responses.
+"""
+
+import csv
+import importlib
+from collections.abc import Callable, Iterator, Mapping
+from itertools import chain
+from types import MappingProxyType, ModuleType, TracebackType
+from typing import IO, Any, Self, TextIO, cast
+
+from .types import FORMAT_TYPES, FormatType, ResultType, RowType
+
+# orjson is optional; it decodes job information noticeably faster.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_ALLOWED_FORMATS_STR = ", ".join(sorted(FORMAT_TYPES))
+
+COLUMNAR_FORMATS = frozenset({"arrow", "polars"})
+"""Formats parsed from the binary CSV stream by an optional columnar library."""
+
+
+def validate_format_type(format_type: str) -> None:
+    """Check that a result format is supported.
+
+    Args:
+        format_type: The requested output format.
+
+    Raises:
+        ValueError: If the format is not one of the supported formats.
+
+    """
+    if format_type not in FORMAT_TYPES:
+        err_msg = (
+            f"Unsupported format: '{format_type}'. "
+            f"Allowed formats are: {_ALLOWED_FORMATS_STR}"
+        )
+        raise ValueError(err_msg)
+
+
+def load_json(content: bytes) -> Any:  # noqa: ANN401
+    """Decode a JSON response body.
+
+    `orjson` is used when it is installed (the `fast-json` extra), and the
+    standard library `json` module otherwise.
+
+    Args:
+        content: The raw response body.
+
+    Returns:
+        The decoded JSON value.
+
+    """
+    return _json_loads(content)
+
+
+def _parse_dict(csv_data_io: TextIO) -> ResultType:
+    """Parse CSV rows into dictionaries keyed by header (internal helper)."""
+    return list(csv.DictReader(csv_data_io))
+
+
+def _parse_reader(csv_data_io: TextIO) -> ResultType:
+    """Parse CSV rows into lists of strings (internal helper)."""
+    return list(csv.reader(csv_data_io))
+
+
+def _parse_raw(csv_data_io: TextIO) -> ResultType:
+    """Return the CSV text unparsed (internal helper)."""
+    return csv_data_io.read()
+
+
+_PARSERS: Mapping[str, Callable[[TextIO], ResultType]] = MappingProxyType(
+    {
+        "dict": _parse_dict,
+        "reader": _parse_reader,
+        "csv": _parse_raw,
+    },
+)
+
+
+def parse_csv(csv_data_io: TextIO, format_type: FormatType) -> ResultType:
+    """Parse a CSV text stream into the requested format.
+
+    Args:
+        csv_data_io: A text stream opened with `newline=""`.
+        format_type: The desired output format.
+
+    Returns:
+        The parsed results in the specified format.
+
+    Raises:
+        ValueError: If the format is not one of the text formats
+            ('dict', 'reader' or 'csv').
+
+    """
+    try:
+        _parser = _PARSERS[format_type]
+    except KeyError:
+        validate_format_type(format_type)
+        err_msg = f"Format '{format_type}' is parsed with `parse_columnar`."
+        raise ValueError(err_msg) from None
+    return _parser(csv_data_io)
+
+
+def iter_rows(csv_data_io: TextIO, format_type: FormatType) -> Iterator[RowType]:
+    """Parse a CSV text stream lazily, one row at a time.
+
+    Unlike `parse_csv`, nothing is read until the returned iterator is
+    consumed, so arbitrarily large results can be processed in constant memory.
+
+    Args:
+        csv_data_io: A text stream opened with `newline=""`.
+        format_type: The desired row format, 'dict' or 'reader'.
+
+    Returns:
+        An iterator over the parsed rows.
+
+    Raises:
+        ValueError: If the format is not 'dict' or 'reader'.
+
+    """
+    match format_type:
+        case "dict":
+            return csv.DictReader(csv_data_io)
+        case "reader":
+            return csv.reader(csv_data_io)
+        case _:
+            validate_format_type(format_type)
+            err_msg = f"Format '{format_type}' cannot be streamed row by row."
+            raise ValueError(err_msg)
+
+
+def _import_optional(module_name: str, extra: str) -> ModuleType:
+    """Import an optional dependency or explain how to install it (internal helper)."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        error_msg = (
+            f"This result format requires '{module_name.partition('.')[0]}'. "
+            f"Install it with the '{extra}' extra of custom-simple-salesforce."
+        )
+        raise ImportError(error_msg) from e
+
+
+def _parse_arrow(csv_data: IO[bytes]) -> ResultType:
+    """Parse CSV bytes into a `pyarrow.Table` (internal helper)."""
+    return _import_optional("pyarrow.csv", "arrow").read_csv(csv_data)
+
+
+def _parse_polars(csv_data: IO[bytes]) -> ResultType:
+    """Parse CSV bytes into a `polars.DataFrame` (internal helper)."""
+    return _import_optional("polars", "polars").read_csv(csv_data)
+
+
+_COLUMNAR_PARSERS: Mapping[str, Callable[[IO[bytes]], ResultType]] = MappingProxyType(
+    {
+        "arrow": _parse_arrow,
+        "polars": _parse_polars,
+    },
+)
+
+
+def parse_columnar(csv_data: IO[bytes], format_type: FormatType) -> ResultType:
+    """Parse a binary CSV stream into a columnar table.
+
+    The multithreaded C/Rust parsers of `pyarrow` and `polars` are much faster
+    than `csv.DictReader` on large results and store the data column-wise.
+
+    Args:
+        csv_data: A binary stream of UTF-8 encoded CSV data.
+        format_type: The desired output format, 'arrow' or 'polars'.
+
+    Returns:
+        A `pyarrow.Table` or a `polars.DataFrame`.
+
+    Raises:
+        ValueError: If the format is not a columnar format.
+        ImportError: If the library for the format is not installed.
+
+    """
+    try:
+        _parser = _COLUMNAR_PARSERS[format_type]
+    except KeyError:
+        validate_format_type(format_type)
+        err_msg = f"Format '{format_type}' is not a columnar format."
+        raise ValueError(err_msg) from None
+    return _parser(csv_data)
+
+
+class ResultStream:
+    """Iterate over result rows parsed from an open HTTP response.
+
+    Rows are parsed as they are iterated, so only the current chunk of the
+    response body is held in memory. The response is released as soon as the
+    rows are exhausted, when `close` is called, or when leaving a `with` block.
+
+    Args:
+        rows (Iterator[RowType]): The lazily parsed rows.
+        close (Callable[[], None]): Releases the underlying response.
+
+    """
+
+    __slots__ = ("_close", "_rows")
+
+    def __init__(
+        self: "ResultStream",
+        rows: Iterator[RowType],
+        close: Callable[[], None],
+    ) -> None:
+        """Initialize the stream."""
+        self._rows = rows
+        self._close = close
+
+    def __iter__(self: "ResultStream") -> Self:
+        """Return the stream itself."""
+        return self
+
+    def __next__(self: "ResultStream") -> RowType:
+        """Parse and return the next row, closing the stream at the end."""
+        try:
+            return next(self._rows)
+        except BaseException:
+            # Exhausted (StopIteration) or failed: the response is done either way.
+            self.close()
+            raise
+
+    def __enter__(self: "ResultStream") -> Self:
+        """Return the stream itself for use as a context manager."""
+        return self
+
+    def __exit__(
+        self: "ResultStream",
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the response when leaving the context."""
+        self.close()
+
+    def close(self: "ResultStream") -> None:
+        """Release the underlying response. Calling it again has no effect."""
+        self._close()
+
+    def to_list(self: "ResultStream") -> list[RowType]:
+        """Read all remaining rows into a list and release the response.
+
+        Returns:
+            The remaining rows.
+
+        """
+        with self:
+            return list(self._rows)
+
+
+def merge_results(results: list[ResultType], format_type: FormatType) -> ResultType:
+    """Merge several CSV results of the same shape into one.
+
+    The header row is kept only from the first result.
+
+    Args:
+        results: The results to merge, in order. Each must be in `format_type`.
+        format_type: The format of the given results.
+
+    Returns:
+        The merged results in the same format.
+
+    """
+    match format_type:
+        case "dict":
+            return list(
+                chain.from_iterable(
+                    cast("list[dict[str, Any]]", _result) for _result in results
+                ),
+            )
+        case "reader":
+            return list(
+                chain.from_iterable(
+                    cast("list[list[str]]", _result)[1 if _index else 0 :]
+                    for _index, _result in enumerate(results)
+                ),
+            )
+        case "arrow":
+            return _import_optional("pyarrow", "arrow").concat_tables(results)
+        case "polars":
+            return _import_optional("polars", "polars").concat(results)
+        case _:
+            _parts: list[str] = []
+            for _index, _result in enumerate(results):
+                _text = cast("str", _result)
+                if _index:
+                    _text = _text.partition("\n")[2]
+                if not _text:
+                    continue
+                # Keep the last row of a page off the first row of the next one.
+                if _parts and not _parts[-1].endswith("\n"):
+                    _parts.append("\n")
+                _parts.append(_text)
+            return "".join(_parts)
@@ -0,0 +1,46 @@
+"""Shared HTTP helpers for Salesforce Bulk API 2.0 clients.
+
+Both the synchronous and the asynchronous Bulk clients send the same headers
+and address the same endpoints. This module builds those headers and resolves
+endpoints against the Bulk API base URL.
+"""
+
+from urllib.parse import urljoin
+
+# Endpoints starting with these are server-relative paths or absolute URLs.
+_RESOLVED_PREFIXES = ("/", "http://", "https://")
+
+
+def bulk_headers(sf_headers: dict[str, str]) -> dict[str, str]:
+    """Build the HTTP headers of a Bulk API client.
+
+    Compressed result downloads are requested, since the CSV payloads
+    compress well.
+
+    Args:
+        sf_headers: The authentication headers of the Salesforce client.
+
+    Returns:
+        The headers to send with every Bulk API request.
+
+    """
+    return {**sf_headers, "Accept-Encoding": "gzip, deflate"}
+
+
+def resolve_url(base_url: str, endpoint: str) -> str:
+    """Build the URL of a Bulk API request.
+
+    Job endpoints are plain relative paths and only need the base URL
+    prepended; links returned by the API (e.g., result pages) are resolved.
+
+    Args:
+        base_url: The base URL for Bulk API 2.0 endpoints.
+        endpoint: A job endpoint, a server-relative path, or an absolute URL.
+
+    Returns:
+        The absolute URL.
+
+    """
+    if endpoint.startswith(_RESOLVED_PREFIXES):
+        return urljoin(base_url, endpoint)
+    return base_url + endpoint
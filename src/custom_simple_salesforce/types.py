@@ -1,8 +1,22 @@
 """Shared type definitions for the Salesforce Bulk API client."""
 
-from typing import Any, Literal
+from collections.abc import Iterable
+from os import PathLike
+from typing import IO, TYPE_CHECKING, Any, Literal, Union, get_args
 
-type ResultType = list[dict[str, Any]] | list[list[str]] | str
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+# The optional columnar types are forward references so that the alias can be
+# evaluated at runtime without pyarrow or polars; `|` does not accept strings.
+type ResultType = Union[  # noqa: UP007
+    list[dict[str, Any]],
+    list[list[str]],
+    str,
+    "pa.Table",
+    "pl.DataFrame",
+]
 """Represents the parsed data type returned from the Salesforce API.
 
 The concrete type depends on the `format_type` argument provided to
@@ -11,7 +25,35 @@ the result-fetching methods. It can be one of the following:
 - `'dict'`: A list of dictionaries (`list[dict[str, Any]]`).
 - `'reader'`: A list of lists representing CSV rows (`list[list[str]]`).
 - `'csv'`: A raw CSV string (`str`).
+- `'arrow'`: A `pyarrow.Table` (requires the `arrow` extra).
+- `'polars'`: A `polars.DataFrame` (requires the `polars` extra).
 """
 
-type FormatType = Literal["dict", "reader", "csv"]
+type RowType = dict[str, Any] | list[str]
+"""Represents a single parsed CSV row yielded by the streaming result methods.
+
+- `'dict'`: A dictionary keyed by the header row (`dict[str, Any]`).
+- `'reader'`: A list of column values (`list[str]`).
+"""
+
+type FormatType = Literal["dict", "reader", "csv", "arrow", "polars"]
 """Specifies the desired output format for query results."""
+
+FORMAT_TYPES: frozenset[str] = frozenset(get_args(FormatType.__value__))
+"""The values of `FormatType`, for validating formats at runtime."""
+
+type OperationType = Literal["insert", "update", "upsert", "delete", "hardDelete"]
+"""Specifies the DML operation of a Bulk API 2.0 ingest job."""
+
+type UploadDataType = str | bytes | PathLike[str] | IO[bytes] | Iterable[bytes]
+"""Represents the CSV data accepted by the ingest upload methods.
+
+It can be one of the following:
+
+- `str`: CSV text, encoded as UTF-8 before sending.
+- `bytes`: UTF-8 encoded CSV data, sent as is.
+- `os.PathLike`: A path to a CSV file, streamed from disk.
+- `IO[bytes]`: A binary file-like object, streamed as it is read.
+- `Iterable[bytes]`: UTF-8 encoded chunks (e.g., a generator), sent with
+  chunked transfer encoding.
+"""
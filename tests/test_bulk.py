@@ -0,0 +1,258 @@
+"""Tests for the synchronous Bulk API 2.0 client."""
+
+import gzip
+import io
+import json
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from custom_simple_salesforce.bulk import SfBulk, _split_csv
+from custom_simple_salesforce.types import UploadDataType
+
+# A quoted field with a CRLF inside, which line-based parsing would split.
+CSV_DATA = b'Id,Name\r\n001,"Acme\r\nCorp"\r\n002,Globex\r\n'
+
+
+class _BulkServer(ThreadingHTTPServer):
+    """A local stand-in for the Bulk API 2.0 endpoints."""
+
+    # Uploaded request bodies, in the order they were received.
+    uploads: list[bytes]
+    # Statuses for the next uploads; later uploads get HTTP 201.
+    upload_statuses: list[int]
+    # IDs of the created jobs, and the (job ID, state) of every state change.
+    jobs: list[str]
+    state_changes: list[tuple[str, str]]
+
+
+class _BulkHandler(BaseHTTPRequestHandler):
+    """Serve `CSV_DATA` results and record created jobs and uploaded batches.
+
+    Results are gzip-compressed for job IDs containing 'gzip'.
+    """
+
+    server: _BulkServer
+
+    def do_GET(self) -> None:
+        _compressed = "gzip" in self.path
+        _body = gzip.compress(CSV_DATA) if _compressed else CSV_DATA
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(_body)))
+        if _compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(_body)
+
+    def do_PUT(self) -> None:
+        _body = self._read_body()
+        if self.headers.get("Content-Encoding") == "gzip":
+            _body = gzip.decompress(_body)
+        self.server.uploads.append(_body)
+        _statuses = self.server.upload_statuses
+        self._send_json(_statuses.pop(0) if _statuses else 201)
+
+    def do_POST(self) -> None:
+        self._read_body()
+        _job_id = f"job{len(self.server.jobs)}"
+        self.server.jobs.append(_job_id)
+        self._send_json(200, {"id": _job_id, "state": "Open"})
+
+    def do_PATCH(self) -> None:
+        _state = json.loads(self._read_body())["state"]
+        _job_id = self.path.rsplit("/", 1)[-1]
+        self.server.state_changes.append((_job_id, _state))
+        self._send_json(200, {"id": _job_id, "state": _state})
+
+    def _send_json(self, status: int, payload: object = None) -> None:
+        """Send a JSON response, or an empty one if there is no payload."""
+        _body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_body)))
+        self.end_headers()
+        self.wfile.write(_body)
+
+    def _read_body(self) -> bytes:
+        """Read a fixed-length or chunked request body."""
+        if "Content-Length" in self.headers:
+            return self.rfile.read(int(self.headers["Content-Length"]))
+        _body = b""
+        while _size := int(self.rfile.readline().strip(), 16):
+            _body += self.rfile.read(_size)
+            self.rfile.readline()
+        self.rfile.readline()
+        return _body
+
+    def log_message(self, *_args: object) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[_BulkServer]:
+    """Run a local HTTP server for the duration of the module."""
+    _server = _BulkServer(("127.0.0.1", 0), _BulkHandler)
+    threading.Thread(target=_server.serve_forever, daemon=True).start()
+    yield _server
+    _server.shutdown()
+    _server.server_close()
+
+
+@pytest.fixture
+def sf_bulk(server: _BulkServer) -> Iterator[SfBulk]:
+    """Create a client pointing at the local server."""
+    server.uploads = []
+    server.upload_statuses = []
+    server.jobs = []
+    server.state_changes = []
+    _host, _port = server.server_address[:2]
+    _sf = SimpleNamespace(bulk2_url=f"http://{_host}:{_port}/", headers={})
+    with SfBulk(_sf) as _sf_bulk:
+        # The pooled, retrying adapters are mounted for HTTPS only.
+        for _session in (_sf_bulk._session, _sf_bulk._stream_session):  # noqa: SLF001
+            _session.mount("http://", _session.get_adapter("https://"))
+        yield _sf_bulk
+
+
+@pytest.mark.parametrize("job_id", ["plain", "gzip"])
+def test_get_results_parses_streamed_body(sf_bulk: SfBulk, job_id: str) -> None:
+    assert sf_bulk.query.get_results(job_id, format_type="dict") == [
+        {"Id": "001", "Name": "Acme\r\nCorp"},
+        {"Id": "002", "Name": "Globex"},
+    ]
+    assert sf_bulk.query.get_results(job_id, format_type="reader") == [
+        ["Id", "Name"],
+        ["001", "Acme\r\nCorp"],
+        ["002", "Globex"],
+    ]
+    assert sf_bulk.query.get_results(job_id, format_type="csv") == CSV_DATA.decode()
+
+
+@pytest.mark.parametrize("job_id", ["plain", "gzip"])
+def test_iter_results_streams_rows(sf_bulk: SfBulk, job_id: str) -> None:
+    with sf_bulk.query.iter_results(job_id, format_type="dict") as _rows:
+        assert _rows.to_list() == [
+            {"Id": "001", "Name": "Acme\r\nCorp"},
+            {"Id": "002", "Name": "Globex"},
+        ]
+    assert sf_bulk.query.iter_results(job_id, format_type="reader").to_list() == [
+        ["Id", "Name"],
+        ["001", "Acme\r\nCorp"],
+        ["002", "Globex"],
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize(
+    "make_body",
+    [lambda: CSV_DATA, lambda: io.BytesIO(CSV_DATA)],
+    ids=["bytes", "file"],
+)
+def test_upload_retries_resendable_body(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+    make_body: Callable[[], UploadDataType],
+    *,
+    compress: bool,
+) -> None:
+    server.upload_statuses = [503]
+    sf_bulk.ingest.upload_data("job", make_body(), compress=compress)
+    assert server.uploads == [CSV_DATA, CSV_DATA]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_upload_does_not_retry_streamed_chunks(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+    *,
+    compress: bool,
+) -> None:
+    server.upload_statuses = [503]
+    with pytest.raises(requests.HTTPError):
+        sf_bulk.ingest.upload_data("job", iter([CSV_DATA]), compress=compress)
+    assert server.uploads == [CSV_DATA]
+
+
+def test_upload_file_retries_compressed_file(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+    tmp_path: Path,
+) -> None:
+    _path = tmp_path / "accounts.csv"
+    _path.write_bytes(CSV_DATA)
+    server.upload_statuses = [503]
+    sf_bulk.ingest.upload_file("job", _path, compress=True)
+    assert server.uploads == [CSV_DATA, CSV_DATA]
+
+
+def test_ingest_parallel_uploads_every_chunk(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+) -> None:
+    _job = sf_bulk.ingest_parallel(
+        "Account",
+        "insert",
+        "Name\na\nb\nc\n",
+        max_workers=2,
+        chunk_rows=1,
+    )
+    assert sorted(_child.id for _child in _job.jobs) == ["job0", "job1", "job2"]
+    assert sorted(server.uploads) == [b"Name\na\n", b"Name\nb\n", b"Name\nc\n"]
+
+
+def test_ingest_parallel_aborts_created_jobs_on_failure(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+) -> None:
+    server.upload_statuses = [201, 400]
+    with pytest.raises(requests.HTTPError):
+        sf_bulk.ingest_parallel(
+            "Account",
+            "insert",
+            "Name\na\nb\nc\n",
+            max_workers=1,
+            chunk_rows=1,
+        )
+    # The third chunk is never started; both created jobs are aborted.
+    assert server.jobs == ["job0", "job1"]
+    assert server.state_changes == [
+        ("job0", "UploadComplete"),
+        ("job0", "Aborted"),
+        ("job1", "Aborted"),
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("container", [list, tuple])
+def test_upload_streams_chunk_sequences(
+    sf_bulk: SfBulk,
+    server: _BulkServer,
+    container: Callable[[list[bytes]], UploadDataType],
+    *,
+    compress: bool,
+) -> None:
+    _chunks = container([b"Id,Name\n", b"1,a\n", b"2,b\n"])
+    sf_bulk.ingest.upload_data("job", _chunks, compress=compress)
+    assert server.uploads == [b"Id,Name\n1,a\n2,b\n"]
+
+
+def test_split_csv_limits_chunks_by_encoded_size() -> None:
+    # 3 bytes per character in UTF-8; the header line alone is 7 bytes.
+    _csv_data = "名前\n山田太郎\n鈴木一郎\n佐藤\n"
+    _chunks = list(_split_csv(_csv_data, chunk_rows=100, max_bytes=30))
+    assert _chunks == ["名前\n山田太郎\n", "名前\n鈴木一郎\n佐藤\n"]
+    assert all(len(_chunk.encode()) <= 30 for _chunk in _chunks)  # noqa: PLR2004
+
+
+def test_split_csv_keeps_quoted_line_breaks() -> None:
+    _csv_data = 'Id,Name\n1,"Acme\nCorp"\n2,Globex\n3,Initech\n'
+    assert list(_split_csv(_csv_data, chunk_rows=2)) == [
+        'Id,Name\n1,"Acme\nCorp"\n2,Globex\n',
+        "Id,Name\n3,Initech\n",
+    ]
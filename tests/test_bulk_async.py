@@ -0,0 +1,50 @@
+"""Tests for the asynchronous Bulk API 2.0 client."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from custom_simple_salesforce.bulk_async import AsyncSfBulk  # noqa: E402
+
+
+def test_run_ingest_aborts_unfinished_jobs() -> None:
+    _jobs: list[str] = []
+    _aborted: list[str] = []
+
+    def _handle(request: httpx.Request) -> httpx.Response:
+        _path = request.url.path
+        if request.method == "POST":
+            _jobs.append(f"job{len(_jobs) + 1}")
+            return httpx.Response(200, json={"id": _jobs[-1]})
+        if request.method == "PUT":
+            # The first batch fails to upload while the second is processed.
+            return httpx.Response(500 if "job1" in _path else 201)
+        if request.method == "PATCH":
+            if json.loads(request.content)["state"] == "Aborted":
+                _aborted.append(_path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={})
+        return httpx.Response(200, json={"state": "InProgress"})
+
+    async def _run() -> None:
+        _sf = SimpleNamespace(bulk2_url="https://example.com/", headers={})
+        async with AsyncSfBulk(_sf) as _sf_bulk:
+            await _sf_bulk._client.aclose()  # noqa: SLF001
+            _sf_bulk._client = httpx.AsyncClient(  # noqa: SLF001
+                transport=httpx.MockTransport(_handle),
+            )
+            with pytest.raises(httpx.HTTPStatusError):
+                async for _ in _sf_bulk.run_ingest(
+                    "Account",
+                    "insert",
+                    ["Name\nA\n", "Name\nB\n"],
+                    interval=0.01,
+                ):
+                    pass
+
+    asyncio.run(_run())
+    assert sorted(_jobs) == ["job1", "job2"]
+    assert sorted(_aborted) == ["job1", "job2"]
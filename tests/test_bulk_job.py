@@ -0,0 +1,26 @@
+"""Tests for the Bulk API 2.0 job wrappers."""
+
+import json
+from types import SimpleNamespace
+
+from custom_simple_salesforce.bulk_job import SfBulkJob
+
+
+def _make_job(**job_info: object) -> SfBulkJob:
+    return SfBulkJob(SimpleNamespace(ingest=None), {"id": "job1", **job_info})
+
+
+def test_info_is_serializable_and_drives_state() -> None:
+    _job = _make_job(state="Open")
+    assert json.loads(json.dumps(_job.info)) == {"id": "job1", "state": "Open"}
+
+    _job.info = {"id": "job1", "state": "JobComplete"}
+    assert _job.state == "JobComplete"
+    assert _job.is_terminal()
+    assert _job.is_successful()
+
+
+def test_has_failed_records_accepts_string_count() -> None:
+    assert _make_job(numberRecordsFailed="3").has_failed_records()
+    assert not _make_job(numberRecordsFailed="0").has_failed_records()
+    assert not _make_job(numberRecordsFailed=None).has_failed_records()
@@ -0,0 +1,26 @@
+"""Tests for the shared polling primitives."""
+
+import pytest
+
+from custom_simple_salesforce.polling import PollSettings
+
+
+def test_delay_grows_up_to_max_delay() -> None:
+    _settings = PollSettings(min_delay=0.5, max_delay=30.0, jitter=0.0)
+    assert [_settings.delay(_attempt) for _attempt in range(8)] == [
+        0.5,
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        16.0,
+        30.0,
+        30.0,
+    ]
+
+
+@pytest.mark.parametrize("attempt", [1024, 10**6])
+def test_delay_does_not_overflow_on_long_waits(attempt: int) -> None:
+    assert PollSettings(jitter=0.0).delay(attempt) == PollSettings().max_delay
+    assert PollSettings(min_delay=1.0, max_delay=1.0).delay(attempt) <= 1.25  # noqa: PLR2004
+    assert PollSettings(min_delay=0.0).delay(attempt) == 0.0
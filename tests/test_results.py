@@ -0,0 +1,10 @@
+"""Tests for the result parsing helpers."""
+
+from custom_simple_salesforce.results import merge_results
+
+
+def test_merge_csv_separates_pages() -> None:
+    assert merge_results(["a,b\n1,2", "a,b\n3,4\n"], "csv") == "a,b\n1,2\n3,4\n"
+    assert merge_results(["a,b\n1,2\n", "a,b\n", "a,b\n3,4"], "csv") == (
+        "a,b\n1,2\n3,4"
+    )
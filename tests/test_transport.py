@@ -0,0 +1,22 @@
+"""Tests for the shared HTTP helpers."""
+
+import pytest
+
+from custom_simple_salesforce.transport import resolve_url
+
+BASE_URL = "https://example.my.salesforce.com/services/data/v64.0/jobs/"
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("ingest/750x", f"{BASE_URL}ingest/750x"),
+        (
+            "/services/data/v64.0/jobs/query/750x/resultPages",
+            f"{BASE_URL}query/750x/resultPages",
+        ),
+        ("https://other.example.com/page", "https://other.example.com/page"),
+    ],
+)
+def test_resolve_url(endpoint: str, expected: str) -> None:
+    assert resolve_url(BASE_URL, endpoint) == expected
@@ -0,0 +1,14 @@
+"""Tests for the shared type definitions."""
+
+from typing import get_args
+
+from custom_simple_salesforce.types import FORMAT_TYPES, FormatType, ResultType
+
+
+def test_result_type_evaluates_without_optional_packages() -> None:
+    # The columnar members stay unresolved forward references.
+    assert len(get_args(ResultType.__value__)) == len(FORMAT_TYPES)
+
+
+def test_format_types_match_alias() -> None:
+    assert set(get_args(FormatType.__value__)) == FORMAT_TYPES